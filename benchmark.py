@@ -0,0 +1,180 @@
+import argparse
+import random
+import time
+import timeit
+
+from core.geometry_utils import GeometryUtils
+from core.shapely_helper import ShapelyHelper
+from core.voronoi_geometry import VoronoiGeometry
+from core.voronoi_diagram import VoronoiDiagram
+
+
+def random_points(n, extent=1000.0, seed=0):
+    rng = random.Random(seed)
+    return [(rng.uniform(-extent, extent), rng.uniform(-extent, extent)) for _ in range(n)]
+
+
+def make_diagram(bbox=1000.0, backend=None, **kwargs):
+    sh = ShapelyHelper(backend)
+    return VoronoiDiagram(sh, VoronoiGeometry(sh), bbox=bbox, **kwargs)
+
+
+def build_diagram(points, bbox=1000.0, **kwargs):
+    vd = make_diagram(bbox, **kwargs)
+    vd.incremental_voronoi(points)
+    return vd
+
+
+def bench_geometry_utils(number=100000):
+    a, b = (1.5, 2.5), (4.0, -3.0)
+    a_np, b_np = GeometryUtils.to_np(a), GeometryUtils.to_np(b)
+
+    print(f"GeometryUtils, {number} calls each")
+    for name in ("dist", "midpoint", "vec"):
+        fn = getattr(GeometryUtils, name)
+        t_tuple = timeit.timeit(lambda: fn(a, b), number=number)
+        t_array = timeit.timeit(lambda: fn(a_np, b_np), number=number)
+        print(f"  {name:<10} tuple {t_tuple:.3f}s  ndarray {t_array:.3f}s  "
+              f"speedup {t_array / t_tuple:.1f}x")
+
+
+def bench_insert_site(n=2000, insertion="walk"):
+    points = random_points(n)
+    start = time.perf_counter()
+    build_diagram(points, insertion=insertion)
+    elapsed = time.perf_counter() - start
+    print(f"insert_site ({insertion}), {n} sites: {elapsed:.3f}s, {n / elapsed:.0f} sites/s")
+
+
+def bench_insertion_order(n=2000):
+    points = sorted(random_points(n))
+    print(f"incremental_voronoi on {n} x-sorted sites")
+    for order in (None, "hilbert", "zorder", "brio"):
+        start = time.perf_counter()
+        make_diagram().incremental_voronoi(points, order=order, seed=0)
+        elapsed = time.perf_counter() - start
+        print(f"  order={order!s:<8} {elapsed:.3f}s")
+
+
+def bench_move_site(n=10000, moves=5000, step=1.0):
+    vd = build_diagram(random_points(n))
+    rng = random.Random(1)
+    cells = list(vd.cells)
+
+    start = time.perf_counter()
+    for _ in range(moves):
+        cell = rng.choice(cells)
+        x, y = cell.generator
+        target = (x + rng.uniform(-step, step), y + rng.uniform(-step, step))
+        if vd.cell_at(target) is None:
+            vd.move_site(cell, target)
+    elapsed = time.perf_counter() - start
+    print(f"move_site on {n} sites, step {step}: {moves / elapsed:.0f} moves/s {vd.move_stats}")
+
+
+def bench_insert_sites(n=20000):
+    points = random_points(n)
+    for name, build in (("insert_site loop", lambda vd: vd.incremental_voronoi(points)),
+                        ("insert_sites", lambda vd: vd.insert_sites(points, seed=0))):
+        vd = make_diagram()
+        start = time.perf_counter()
+        build(vd)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16} {n} sites: {elapsed:.3f}s")
+
+
+def bench_engines(n=20000):
+    points = random_points(n)
+    for engine in ("incremental", "sweep"):
+        vd = make_diagram(engine=engine)
+        start = time.perf_counter()
+        vd.incremental_voronoi(points)
+        elapsed = time.perf_counter() - start
+        print(f"{engine:<16} {n} sites: {elapsed:.3f}s")
+
+
+def bench_parallel(n=100000, workers=None):
+    points = random_points(n)
+    for label, build in (("serial", lambda vd: vd.incremental_voronoi(points)),
+                         ("parallel", lambda vd: vd.parallel_voronoi(points, workers=workers))):
+        vd = make_diagram(engine="sweep")
+        start = time.perf_counter()
+        build(vd)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} {n} sites: {elapsed:.3f}s {vd.tile_stats if label == 'parallel' else ''}")
+
+
+def bench_locate(n=10000, queries=5000):
+    vd = build_diagram(random_points(n), engine="sweep")
+    rng = random.Random(2)
+    scattered = random_points(queries, seed=3)
+    x = y = 0.0
+    coherent = []
+    for _ in range(queries):
+        x += rng.uniform(-5.0, 5.0)
+        y += rng.uniform(-5.0, 5.0)
+        coherent.append((x, y))
+
+    for label, points in (("scattered", scattered), ("coherent", coherent)):
+        vd.locate_stats = {"walks": 0, "steps": 0, "fallbacks": 0}
+        start = time.perf_counter()
+        for q in points:
+            vd.locate(q)
+        elapsed = time.perf_counter() - start
+        print(f"locate {label:<10} {n} sites: {elapsed / queries * 1e6:.1f}us/query {vd.locate_stats}")
+
+
+def bench_spatial_join(n=10000, queries=2000000, workers=None):
+    vd = build_diagram(random_points(n), engine="sweep")
+    points = GeometryUtils.np.random.default_rng(4).uniform(-1000.0, 1000.0, (queries, 2))
+    for label, kwargs in (("1 worker", {"workers": 1}), ("threads", {"workers": workers})):
+        start = time.perf_counter()
+        vd.spatial_join(points, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"spatial_join {label:<10} {queries} points / {n} cells: {queries / elapsed / 1e6:.2f}M points/s")
+
+
+def bench_backends(n=5000, queries=20000):
+    points = random_points(n)
+    queries = GeometryUtils.np.random.default_rng(5).uniform(-1000.0, 1000.0, (queries, 2))
+    for backend in ("python", "numpy", "shapely"):
+        start = time.perf_counter()
+        vd = build_diagram(points, backend=backend, insertion="brute")
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        vd.locate_many(queries)
+        located = time.perf_counter() - start
+        print(f"backend {backend:<8} {n} sites: build {built:.3f}s, locate_many {len(queries)} points {located:.3f}s")
+
+
+BENCHMARKS = {
+    "geometry": lambda args: bench_geometry_utils(),
+    "insert": lambda args: bench_insert_site(args.n, args.insertion),
+    "order": lambda args: bench_insertion_order(args.n),
+    "move": lambda args: bench_move_site(args.n),
+    "bulk": lambda args: bench_insert_sites(args.n),
+    "engine": lambda args: bench_engines(args.n),
+    "parallel": lambda args: bench_parallel(args.n, args.workers),
+    "locate": lambda args: bench_locate(args.n),
+    "join": lambda args: bench_spatial_join(args.n, workers=args.workers),
+    "backend": lambda args: bench_backends(args.n),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Voronoi micro-benchmarks")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run: {', '.join(sorted(BENCHMARKS))} (default: all)")
+    parser.add_argument("-n", type=int, default=2000, help="number of sites")
+    parser.add_argument("--insertion", default="walk", choices=("walk", "brute"))
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for the parallel benchmark")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    for name in args.names or sorted(BENCHMARKS):
+        BENCHMARKS[name](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,138 @@
+import math
+
+from core.cell_store import CellStore
+from core.geometry_backend import DEFAULT_BACKEND
+from core.geometry_utils import GeometryUtils
+
+
 class Cell:
-    def __init__(self, generator, polygon=None, shapely_helper=None, voronoi_geo=None):
+    __slots__ = ("sh", "vg", "store", "index", "site_id", "_cache")
+
+    def __init__(self, generator, polygon=None, shapely_helper=None, voronoi_geo=None,
+                 site_id=None, store=None):
         self.sh = shapely_helper
         self.vg = voronoi_geo
-        self.generator = tuple(map(float, generator))
+        self._cache = None
+        self.store = CellStore(capacity=1, vertex_capacity=8) if store is None else store
+        self.index = self.store.add(tuple(map(float, generator)))
+        self.site_id = self.index if site_id is None and store is not None else site_id
+        if self.site_id is not None:
+            self.store.views[self.site_id] = self
 
-        if polygon is None:
-            self.polygon = []
-        else:
+        if polygon is not None:
             self.update_polygon(polygon)
 
-    def update_polygon(self, polygon):
+    @property
+    def generator(self):
+        return tuple(self.store.generators[self.index].tolist())
+
+    @property
+    def polygon(self):
+        return [tuple(p) for p in self.store.ring(self.index).tolist()]
+
+    @property
+    def radius(self):
+        return float(self.store.radii[self.index])
+
+    @property
+    def edge_sites(self):
+        return self.store.ring_labels(self.index).tolist()
+
+    def update_polygon(self, polygon, edge_sites=None):
         if polygon is None:
-            self.polygon = []
+            self.store.set_ring(self.index, ())
             return
 
         if self.sh and hasattr(polygon, 'exterior'):
-            self.polygon = list(polygon.exterior.coords)[:-1]
+            polygon = list(polygon.exterior.coords)[:-1]
+
+        self.store.set_ring(self.index, polygon, edge_sites)
+
+    def neighbor_ids(self):
+        return {s for s in self.edge_sites if s >= 0}
+
+    def neighbors(self):
+        views = self.store.views
+        return [views[s] for s in sorted(self.neighbor_ids()) if s in views]
+
+    def _derived(self):
+        store, index = self.store, self.index
+        if store.derived[index] == store.versions[index]:
+            store.cache_hits += 1
         else:
-            self.polygon = [tuple(map(float, p)) for p in polygon]
+            store.cache_misses += 1
+            store.refresh_derived(index)
+        return index
 
     def area(self):
-        if not self.polygon:
-            return 0.0
+        return float(self.store.areas[self._derived()])
+
+    def bounds(self):
+        index = self._derived()
+        return tuple(self.store.bounds[index].tolist()) if self.store.counts[index] else None
+
+    def centroid(self):
+        index = self._derived()
+        return tuple(self.store.centroids[index].tolist()) if self.store.counts[index] else None
 
-        if self.sh and self.sh.has_shapely:
-            return float(self.sh.Polygon(self.polygon).area)
+    def prepared(self):
+        return self._prepare() if self.store.counts[self.index] else None
 
-        pts = self.polygon
-        s = 0.0
-        n = len(pts)
-        for i in range(n):
-            x1, y1 = pts[i]
-            x2, y2 = pts[(i + 1) % n]
-            s += x1*y2 - x2*y1
-        return abs(s) * 0.5
+    def backend(self):
+        return getattr(self.sh, "backend", None) or DEFAULT_BACKEND
+
+    def _prepare(self):
+        version = self.store.versions[self.index]
+        if self._cache is None or self._cache[0] != version:
+            self._cache = (version, self.backend().prepare(self.store.ring(self.index).tolist()))
+        return self._cache[1]
 
     def contains(self, point):
-        p = tuple(map(float, point))
+        x, y = map(float, point)
+        bounds = self.bounds()
+
+        if bounds is None:
+            return False
 
-        if not self.polygon:
+        minx, miny, maxx, maxy = bounds
+        if x < minx or x > maxx or y < miny or y > maxy:
             return False
 
-        if self.sh and self.sh.has_shapely:
-            return self.sh.Polygon(self.polygon).contains(self.sh.Point(p))
+        return self.backend().contains(self._prepare(), (x, y))
 
-        x, y = p
-        inside = False
-        pts = self.polygon
-        n = len(pts)
-        for i in range(n):
-            xi, yi = pts[i]
-            xj, yj = pts[(i + 1) % n]
-            intersect = ((yi > y) != (yj > y)) and \
-                        (x < (xj - xi) * (y - yi) / (yj - yi + 1e-18) + xi)
-            if intersect:
-                inside = not inside
+    def contains_many(self, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        mask = np.zeros(len(pts), dtype=bool)
+        bounds = self.bounds()
 
-        return inside
+        if bounds is None:
+            return mask
 
-    def clip_with_halfplane(self, line, keep_positive=True):
+        minx, miny, maxx, maxy = bounds
+        x, y = pts[:, 0], pts[:, 1]
+        candidates = np.flatnonzero((x >= minx) & (x <= maxx) & (y >= miny) & (y <= maxy))
+        if len(candidates):
+            mask[candidates] = self.backend().contains_many(self._prepare(), pts[candidates])
+        return mask
+
+    def clip_with_halfplane(self, line, keep_positive=True, site_id=-1, eps=0.0):
         if not self.vg:
             raise RuntimeError("VoronoiGeometry instance not attached to Cell")
 
-        clipped = self.vg.clip_polygon_by_halfplane(self.polygon, line, keep_positive)
-        self.update_polygon(clipped)
+        a, b, c = line
+        norm = math.hypot(a, b)
+        if norm:
+            gx, gy = self.generator
+            side = (a*gx + b*gy + c) / norm
+            if (side if keep_positive else -side) - self.radius > eps * (abs(gx) + abs(gy) + abs(side)):
+                self.store.culled += 1
+                return self.polygon
+
+        clipped, edge_sites = self.vg.clip_labeled_polygon(
+            self.polygon, self.edge_sites, line, keep_positive, site_id, eps
+        )
+        self.update_polygon(clipped, edge_sites)
         return self.polygon
 
     def __repr__(self):
@@ -0,0 +1,206 @@
+from core.geometry_utils import GeometryUtils
+
+
+class CellStore:
+    def __init__(self, capacity=16, vertex_capacity=64):
+        np = GeometryUtils.np
+        self.generators = np.zeros((capacity, 2))
+        self.starts = np.zeros(capacity, dtype=np.intp)
+        self.counts = np.zeros(capacity, dtype=np.intp)
+        self.versions = np.zeros(capacity, dtype=np.int64)
+        self.radii = np.zeros(capacity)
+        self.areas = np.zeros(capacity)
+        self.bounds = np.zeros((capacity, 4))
+        self.centroids = np.zeros((capacity, 2))
+        self.derived = np.zeros(capacity, dtype=np.int64)
+        self.vertices = np.zeros((vertex_capacity, 2))
+        self.labels = np.full(vertex_capacity, -1, dtype=np.int64)
+        self.size = 0
+        self.used = 0
+        self.live = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.views = {}
+        self.clipped = 0
+        self.culled = 0
+
+    def __len__(self):
+        return self.size
+
+    def _grow_cells(self, needed):
+        np = GeometryUtils.np
+        capacity = max(needed, 2 * len(self.generators))
+        for name in ("generators", "starts", "counts", "versions", "radii",
+                     "areas", "bounds", "centroids", "derived"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _reserve_vertices(self, n):
+        np = GeometryUtils.np
+        if self.used + n <= len(self.vertices):
+            return
+
+        if self.used > 2 * self.live:
+            self.compact()
+            if self.used + n <= len(self.vertices):
+                return
+
+        capacity = max(self.used + n, 2 * len(self.vertices))
+        vertices = np.zeros((capacity, 2))
+        vertices[:self.used] = self.vertices[:self.used]
+        labels = np.full(capacity, -1, dtype=np.int64)
+        labels[:self.used] = self.labels[:self.used]
+        self.vertices, self.labels = vertices, labels
+
+    def add(self, generator, ring=None, labels=None):
+        index = self.size
+        if index >= len(self.generators):
+            self._grow_cells(index + 1)
+
+        self.generators[index] = generator
+        self.starts[index] = self.used
+        self.counts[index] = 0
+        self.size += 1
+
+        if ring is not None:
+            self.set_ring(index, ring, labels)
+        return index
+
+    def set_ring(self, index, ring, labels=None):
+        np = GeometryUtils.np
+        ring = np.asarray(ring, dtype=float).reshape(-1, 2)
+        n = len(ring)
+        old = int(self.counts[index])
+        if n != old or not np.array_equal(ring, self.ring(index)):
+            self.versions[index] += 1
+
+        if n > old:
+            self._reserve_vertices(n)
+            self.starts[index] = self.used
+            self.used += n
+
+        start = int(self.starts[index])
+        self.vertices[start:start + n] = ring
+        self.labels[start:start + n] = -1 if labels is None else labels
+        self.counts[index] = n
+        self.live += n - old
+        self.refresh_radius(index)
+
+    def ring(self, index):
+        start = self.starts[index]
+        return self.vertices[start:start + self.counts[index]]
+
+    def ring_labels(self, index):
+        start = self.starts[index]
+        return self.labels[start:start + self.counts[index]]
+
+    def compact(self):
+        np = GeometryUtils.np
+        idx, offsets = self._gather_index(np.arange(self.size))
+        self.vertices[:len(idx)] = self.vertices[idx]
+        self.labels[:len(idx)] = self.labels[idx]
+        self.starts[:self.size] = offsets[:-1]
+        self.used = self.live = len(idx)
+
+    def _gather_index(self, indices):
+        np = GeometryUtils.np
+        counts = self.counts[indices]
+        offsets = np.zeros(len(indices) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        idx = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - self.starts[indices], counts)
+        return idx, offsets
+
+    def gather(self, indices):
+        np = GeometryUtils.np
+        indices = np.asarray(indices, dtype=np.intp)
+        idx, offsets = self._gather_index(indices)
+        return self.vertices[idx], offsets, self.labels[idx]
+
+    def scatter(self, indices, vertices, offsets, labels):
+        np = GeometryUtils.np
+        indices = np.asarray(indices, dtype=np.intp)
+        vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.intp)
+        n = int(offsets[-1])
+        self.versions[indices[self._changed(indices, vertices, offsets)]] += 1
+
+        self.live -= int(self.counts[indices].sum())
+        self.counts[indices] = 0
+        self._reserve_vertices(n)
+
+        self.vertices[self.used:self.used + n] = vertices
+        self.labels[self.used:self.used + n] = labels
+        self.starts[indices] = self.used + offsets[:-1]
+        self.counts[indices] = np.diff(offsets)
+        self.used += n
+        self.live += n
+        self._update_radii(indices, vertices, offsets)
+
+    def _update_radii(self, indices, vertices, offsets):
+        np = GeometryUtils.np
+        counts = np.diff(offsets)
+        filled = counts > 0
+        self.radii[indices] = 0.0
+        if not filled.any():
+            return
+        d2 = ((vertices - np.repeat(self.generators[indices], counts, axis=0)) ** 2).sum(axis=1)
+        self.radii[indices[filled]] = np.sqrt(np.maximum.reduceat(d2, offsets[:-1][filled]))
+
+    def refresh_radius(self, index):
+        np = GeometryUtils.np
+        ring = self.ring(index)
+        self.radii[index] = np.sqrt(((ring - self.generators[index]) ** 2).sum(axis=1).max()) if len(ring) else 0.0
+
+    def refresh_derived(self, index):
+        np = GeometryUtils.np
+        ring = self.ring(index)
+        self.derived[index] = self.versions[index]
+        if not len(ring):
+            self.areas[index] = 0.0
+            return
+
+        x, y = ring[:, 0], ring[:, 1]
+        xp, yp = np.roll(x, 1), np.roll(y, 1)
+        cross = xp * y - x * yp
+        s = cross.sum()
+        self.areas[index] = abs(s) * 0.5
+        self.bounds[index, :2] = ring.min(axis=0)
+        self.bounds[index, 2:] = ring.max(axis=0)
+        if s:
+            self.centroids[index] = np.array(((xp + x) @ cross, (yp + y) @ cross)) / (3.0 * s)
+        else:
+            self.centroids[index] = ring.mean(axis=0)
+
+    def _changed(self, indices, vertices, offsets):
+        np = GeometryUtils.np
+        old, old_offsets, _ = self.gather(indices)
+        counts = np.diff(offsets)
+        old_counts = np.diff(old_offsets)
+        changed = counts != old_counts
+
+        polys = np.arange(len(counts))
+        old_rows = ~changed[np.repeat(polys, old_counts)]
+        poly_of = np.repeat(polys, counts)
+        rows = ~changed[poly_of]
+
+        diff = (old[old_rows] != vertices[rows]).any(axis=1)
+        changed |= np.bincount(poly_of[rows], weights=diff, minlength=len(counts)) > 0
+        return changed
+
+    def clip_stats(self):
+        total = self.clipped + self.culled
+        return {
+            "clipped": self.clipped,
+            "culled": self.culled,
+            "cull_rate": self.culled / total if total else 0.0,
+        }
+
+    def cache_stats(self):
+        total = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / total if total else 0.0,
+        }
@@ -0,0 +1,162 @@
+import heapq
+import math
+
+
+class _Arc:
+    __slots__ = ("site", "event")
+
+    def __init__(self, site):
+        self.site = site
+        self.event = None
+
+
+class _CircleEvent:
+    __slots__ = ("arc", "x", "y", "valid")
+
+    def __init__(self, arc, x, y):
+        self.arc = arc
+        self.x = x
+        self.y = y
+        self.valid = True
+
+
+class FortuneSweep:
+    def __init__(self, points):
+        self.points = [(float(x), float(y)) for x, y in points]
+        self.arcs = []
+        self.events = []
+        self.pairs = set()
+        self._seq = 0
+
+    def _push(self, y, kind, x, payload):
+        self._seq += 1
+        heapq.heappush(self.events, (-y, kind, x, self._seq, payload))
+
+    def _breakpoint(self, left, right, l):
+        px, py = self.points[left.site]
+        qx, qy = self.points[right.site]
+
+        if py == qy:
+            return (px + qx) / 2.0
+        if py == l:
+            return px
+        if qy == l:
+            return qx
+
+        dp = 2.0 * (py - l)
+        dq = 2.0 * (qy - l)
+        a = 1.0/dp - 1.0/dq
+        b = -2.0 * (px/dp - qx/dq)
+        c = (px*px + py*py - l*l)/dp - (qx*qx + qy*qy - l*l)/dq
+
+        disc = math.sqrt(max(b*b - 4.0*a*c, 0.0))
+        q = -0.5 * (b + math.copysign(disc, b))
+        roots = [c / q] if q != 0 else []
+        if a != 0:
+            roots.append(q / a)
+        if not roots:
+            return (px + qx) / 2.0
+        return max(roots) if py < qy else min(roots)
+
+    def _find(self, x, l):
+        lo, hi = 0, len(self.arcs) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if x < self._breakpoint(self.arcs[mid], self.arcs[mid + 1], l):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _index_of(self, arc, x, l):
+        i = self._find(x, l)
+        for offset in range(4):
+            for j in (i - offset, i + offset):
+                if 0 <= j < len(self.arcs) and self.arcs[j] is arc:
+                    return j
+        for j, other in enumerate(self.arcs):
+            if other is arc:
+                return j
+        return None
+
+    def _pair(self, i, j):
+        if i != j:
+            self.pairs.add((i, j) if i < j else (j, i))
+
+    def _check_circle(self, j, l):
+        if j <= 0 or j >= len(self.arcs) - 1:
+            return
+        a, b, c = self.arcs[j - 1], self.arcs[j], self.arcs[j + 1]
+        if a.site == c.site:
+            return
+
+        ax, ay = self.points[a.site]
+        bx, by = self.points[b.site]
+        cx, cy = self.points[c.site]
+        d = 2.0 * (ax*(by - cy) + bx*(cy - ay) + cx*(ay - by))
+        if (bx - ax)*(cy - ay) - (cx - ax)*(by - ay) >= 0 or d == 0:
+            return
+
+        a2, b2, c2 = ax*ax + ay*ay, bx*bx + by*by, cx*cx + cy*cy
+        ux = (a2*(by - cy) + b2*(cy - ay) + c2*(ay - by)) / d
+        uy = (a2*(cx - bx) + b2*(ax - cx) + c2*(bx - ax)) / d
+        y = uy - math.hypot(ax - ux, ay - uy)
+
+        event = _CircleEvent(b, ux, min(y, l))
+        b.event = event
+        self._push(event.y, 0, ux, event)
+
+    def _invalidate(self, arc):
+        if arc.event is not None:
+            arc.event.valid = False
+            arc.event = None
+
+    def _site_event(self, site):
+        x, l = self.points[site]
+        if not self.arcs:
+            self.arcs.append(_Arc(site))
+            return
+
+        i = self._find(x, l)
+        arc = self.arcs[i]
+        self._pair(arc.site, site)
+
+        if self.points[arc.site][1] == l:
+            self.arcs.insert(i + 1, _Arc(site))
+            self._check_circle(i, l)
+            self._check_circle(i + 2, l)
+            return
+
+        self._invalidate(arc)
+        self.arcs[i + 1:i + 1] = [_Arc(site), _Arc(arc.site)]
+        self._check_circle(i, l)
+        self._check_circle(i + 2, l)
+
+    def _circle_event(self, event):
+        arc = event.arc
+        j = self._index_of(arc, event.x, event.y)
+        if j is None or j == 0 or j == len(self.arcs) - 1:
+            return
+
+        left, right = self.arcs[j - 1], self.arcs[j + 1]
+        del self.arcs[j]
+        arc.event = None
+        self._pair(left.site, right.site)
+
+        self._invalidate(left)
+        self._invalidate(right)
+        self._check_circle(j - 1, event.y)
+        self._check_circle(j, event.y)
+
+    def neighbor_pairs(self):
+        for site, (x, y) in enumerate(self.points):
+            self._push(y, 1, x, site)
+
+        while self.events:
+            _, kind, _, _, payload = heapq.heappop(self.events)
+            if kind == 1:
+                self._site_event(payload)
+            elif payload.valid:
+                self._circle_event(payload)
+
+        return self.pairs
@@ -0,0 +1,181 @@
+from core.geometry_utils import GeometryUtils
+from core.predicates import Predicates
+
+
+class PythonBackend:
+    name = "python"
+
+    def __init__(self, shapely_helper=None):
+        self.sh = shapely_helper
+
+    def prepare(self, ring):
+        return [tuple(p) for p in ring]
+
+    def contains(self, prepared, point):
+        x, y = point
+        inside = False
+        n = len(prepared)
+        for i in range(n):
+            pi, pj = prepared[i], prepared[(i + 1) % n]
+            if (pi[1] > y) != (pj[1] > y):
+                if (Predicates.orient2d(pi, pj, (x, y)) > 0) == (pj[1] > pi[1]):
+                    inside = not inside
+        return inside
+
+    def contains_many(self, prepared, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        return np.array([self.contains(prepared, p) for p in pts.tolist()], dtype=bool)
+
+    def clip_many(self, vg, vertices, offsets, lines, keep_positive=True, labels=None,
+                  line_labels=-1, eps=0.0):
+        np = GeometryUtils.np
+        verts = np.asarray(vertices, dtype=float).reshape(-1, 2).tolist()
+        offsets = np.asarray(offsets, dtype=np.intp).tolist()
+        n_polys = len(offsets) - 1
+        lines = np.broadcast_to(np.asarray(lines, dtype=float), (n_polys, 3)).tolist()
+        keep = np.broadcast_to(np.asarray(keep_positive, dtype=bool), (n_polys,)).tolist()
+        line_labels = np.broadcast_to(np.asarray(line_labels, dtype=np.int64), (n_polys,)).tolist()
+        vert_labels = [-1] * len(verts) if labels is None else np.asarray(labels).tolist()
+
+        out, out_labels, out_offsets = [], [], [0]
+        for k in range(n_polys):
+            lo, hi = offsets[k], offsets[k + 1]
+            ring, ring_labels = vg.clip_labeled_polygon(
+                [tuple(p) for p in verts[lo:hi]], vert_labels[lo:hi],
+                lines[k], keep[k], line_labels[k], eps
+            )
+            out.extend(ring)
+            out_labels.extend(ring_labels)
+            out_offsets.append(len(out))
+
+        out = np.array(out, dtype=float).reshape(-1, 2)
+        out_offsets = np.array(out_offsets, dtype=np.intp)
+        if labels is None:
+            return out, out_offsets
+        return out, out_offsets, np.array(out_labels, dtype=np.int64)
+
+    def locate_many(self, diagram, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        return self._locate_rest(diagram, pts, np.full(len(pts), -1, dtype=np.int64))
+
+    def _locate_rest(self, diagram, pts, owner):
+        np = GeometryUtils.np
+        b = float(diagram.bbox)
+        rest = np.flatnonzero((owner < 0) & (np.abs(pts[:, 0]) <= b) & (np.abs(pts[:, 1]) <= b))
+        if not len(rest) or not diagram.cells:
+            return owner
+
+        position = {cell.site_id: i for i, cell in enumerate(diagram.cells)}
+        for k, p in zip(rest.tolist(), pts[rest].tolist()):
+            cell = diagram.locate(p)
+            if cell is not None:
+                owner[k] = position[cell.site_id]
+        return owner
+
+
+class NumpyBackend(PythonBackend):
+    name = "numpy"
+
+    def contains_many(self, prepared, points):
+        return GeometryUtils.points_in_polygon(prepared, points)
+
+    def clip_many(self, vg, vertices, offsets, lines, keep_positive=True, labels=None,
+                  line_labels=-1, eps=0.0):
+        return vg.clip_polygons_by_halfplanes(
+            vertices, offsets, lines, keep_positive, labels, line_labels, eps
+        )
+
+    def locate_many(self, diagram, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        owner = np.full(len(pts), -1, dtype=np.int64)
+        if not diagram.cells or not len(pts):
+            return owner
+
+        b = float(diagram.bbox)
+        size = max(1, int(len(diagram.cells) ** 0.5))
+        generators = diagram.store.generators[[cell.index for cell in diagram.cells]]
+        origin = generators.min(axis=0)
+        span = generators.max(axis=0) - origin
+        width = np.where(span > 0, span / size, 1.0)
+
+        def bucket(xy):
+            return np.clip(((xy - origin) // width).astype(np.int64), 0, size - 1)
+
+        inside = (np.abs(pts[:, 0]) <= b) & (np.abs(pts[:, 1]) <= b)
+        candidates = np.flatnonzero(inside)
+        ix, iy = bucket(pts[candidates]).T
+        keys = iy * size + ix
+        order = np.argsort(keys, kind="stable")
+        keys, candidates = keys[order], candidates[order]
+
+        for i, cell in enumerate(diagram.cells):
+            bounds = cell.bounds()
+            if bounds is None:
+                continue
+
+            (ix0, iy0), (ix1, iy1) = bucket(np.reshape(bounds, (2, 2))).tolist()
+            rows = np.arange(iy0, iy1 + 1) * size
+            lo = np.searchsorted(keys, rows + ix0, side="left")
+            hi = np.searchsorted(keys, rows + ix1, side="right")
+            picked = np.concatenate([candidates[l:h] for l, h in zip(lo.tolist(), hi.tolist())])
+            picked = picked[owner[picked] < 0]
+            if len(picked):
+                owner[picked[cell.contains_many(pts[picked])]] = i
+
+        return self._locate_rest(diagram, pts, owner)
+
+
+class ShapelyBackend(NumpyBackend):
+    name = "shapely"
+
+    def __init__(self, shapely_helper=None):
+        super().__init__(shapely_helper)
+        import shapely
+        if not hasattr(shapely, "contains_xy"):
+            raise ImportError("the shapely backend needs Shapely 2 vectorized functions")
+        self.shapely = shapely
+
+    def prepare(self, ring):
+        polygon = self.shapely.Polygon(ring)
+        self.shapely.prepare(polygon)
+        return polygon
+
+    def contains(self, prepared, point):
+        return bool(self.shapely.contains_xy(prepared, point[0], point[1]))
+
+    def contains_many(self, prepared, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        return self.shapely.contains_xy(prepared, pts[:, 0], pts[:, 1])
+
+    def locate_many(self, diagram, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        owner = np.full(len(pts), -1, dtype=np.int64)
+        filled = [i for i, cell in enumerate(diagram.cells) if cell.polygon]
+        if not filled or not len(pts):
+            return owner
+
+        rings = [diagram.cells[i].polygon for i in filled]
+        coords = np.concatenate([np.asarray(r, dtype=float) for r in rings])
+        indices = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+        polygons = self.shapely.polygons(self.shapely.linearrings(coords, indices=indices))
+        tree = self.shapely.STRtree(polygons)
+        hits, slots = tree.query(self.shapely.points(pts), predicate="intersects")
+        positions = np.asarray(filled)[slots]
+        order = np.lexsort((positions, hits))
+        hits, first = np.unique(hits[order], return_index=True)
+        owner[hits] = positions[order][first]
+        return self._locate_rest(diagram, pts, owner)
+
+
+BACKENDS = {
+    "python": PythonBackend,
+    "numpy": NumpyBackend,
+    "shapely": ShapelyBackend,
+}
+
+DEFAULT_BACKEND = NumpyBackend()
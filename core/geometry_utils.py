@@ -1,3 +1,6 @@
+import math
+
+
 class GeometryUtils:
     import numpy as np
 
@@ -11,32 +14,66 @@ class GeometryUtils:
             raise ValueError("to_np expects a 2D point")
         return a.reshape(2,)
 
+    @staticmethod
+    def to_points(p):
+        a = GeometryUtils.np.asarray(p, dtype=float)
+        if a.ndim == 0 or a.shape[-1] != 2:
+            raise ValueError("to_points expects an array of 2D points with shape (..., 2)")
+        return a
+
+    @staticmethod
+    def _batched(*vs):
+        return any(type(v) is not tuple and GeometryUtils.np.ndim(v) > 1 for v in vs)
+
+    @staticmethod
+    def as_xy(p):
+        if type(p) is tuple and len(p) == 2:
+            return float(p[0]), float(p[1])
+        x, y = GeometryUtils.to_np(p)
+        return float(x), float(y)
+
     @staticmethod
     def dist(a, b):
-        a = GeometryUtils.to_np(a)
-        b = GeometryUtils.to_np(b)
-        return ((b - a) ** 2).sum() ** 0.5
+        if type(a) is tuple and type(b) is tuple and len(a) == 2 and len(b) == 2:
+            return math.hypot(b[0] - a[0], b[1] - a[1])
+        d = GeometryUtils.to_points(b) - GeometryUtils.to_points(a)
+        return (d ** 2).sum(axis=-1) ** 0.5
 
     @staticmethod
     def midpoint(a, b):
-        return (GeometryUtils.to_np(a) + GeometryUtils.to_np(b)) / 2.0
+        if type(a) is tuple and type(b) is tuple and len(a) == 2 and len(b) == 2:
+            return ((a[0] + b[0]) / 2.0, (a[1] + b[1]) / 2.0)
+        return (GeometryUtils.to_points(a) + GeometryUtils.to_points(b)) / 2.0
 
     @staticmethod
     def vec(a, b):
-        a = GeometryUtils.to_np(a)
-        b = GeometryUtils.to_np(b)
-        return (b - a)
+        if type(a) is tuple and type(b) is tuple and len(a) == 2 and len(b) == 2:
+            return (b[0] - a[0], b[1] - a[1])
+        return GeometryUtils.to_points(b) - GeometryUtils.to_points(a)
 
     @staticmethod
     def dot(u, v):
+        if GeometryUtils._batched(u, v):
+            u, v = GeometryUtils.to_points(u), GeometryUtils.to_points(v)
+            return (u * v).sum(axis=-1)
         return u[0]*v[0] + u[1]*v[1]
 
     @staticmethod
     def cross(u, v):
+        if GeometryUtils._batched(u, v):
+            u, v = GeometryUtils.to_points(u), GeometryUtils.to_points(v)
+            return u[..., 0]*v[..., 1] - u[..., 1]*v[..., 0]
         return u[0]*v[1] - u[1]*v[0]
 
     @staticmethod
     def normalize(u):
+        if GeometryUtils._batched(u):
+            u = GeometryUtils.to_points(u)
+            length = GeometryUtils.np.hypot(u[..., 0], u[..., 1])
+            if (length == 0).any():
+                raise ValueError("zero-length vector")
+            return u / length[..., None]
+
         length = (u[0]**2 + u[1]**2)**0.5
         if length == 0:
             raise ValueError("zero-length vector")
@@ -44,4 +81,24 @@ class GeometryUtils:
 
     @staticmethod
     def perpendicular(u):
+        if GeometryUtils._batched(u):
+            u = GeometryUtils.to_points(u)
+            return GeometryUtils.np.stack((-u[..., 1], u[..., 0]), axis=-1)
         return (-u[1], u[0])
+
+    @staticmethod
+    def points_in_polygon(polygon, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        ring = np.asarray(polygon, dtype=float).reshape(-1, 2)
+        inside = np.zeros(len(pts), dtype=bool)
+        if len(ring) < 3:
+            return inside
+
+        x, y = pts[:, 0], pts[:, 1]
+        for (xi, yi), (xj, yj) in zip(ring.tolist(), np.roll(ring, -1, axis=0).tolist()):
+            if yi == yj:
+                continue
+            crosses = (yi > y) != (yj > y)
+            inside ^= crosses & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+        return inside
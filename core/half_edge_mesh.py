@@ -0,0 +1,274 @@
+from core.cell_store import CellStore
+from core.geometry_utils import GeometryUtils
+
+
+class HalfEdgeMesh:
+    def __init__(self, capacity=16, edge_capacity=64, vertex_capacity=32):
+        np = GeometryUtils.np
+        self.points = np.zeros((vertex_capacity, 2))
+        self.refs = []
+        self.free = []
+        self.target = np.zeros(edge_capacity, dtype=np.int32)
+        self.twin = np.full(edge_capacity, -1, dtype=np.int32)
+        self.next = np.zeros(edge_capacity, dtype=np.int32)
+        self.cell = np.zeros(edge_capacity, dtype=np.int32)
+        self.site = np.full(edge_capacity, -1, dtype=np.int32)
+        self.first = np.zeros(capacity, dtype=np.intp)
+        self.degree = np.zeros(capacity, dtype=np.intp)
+        self.used = 0
+        self.live = 0
+
+    def __len__(self):
+        return int((self.degree > 0).sum())
+
+    def clear(self):
+        self.refs = []
+        self.free = []
+        self.twin[:] = -1
+        self.degree[:] = 0
+        self.used = 0
+        self.live = 0
+
+    def reserve_cells(self, needed):
+        np = GeometryUtils.np
+        if needed <= len(self.first):
+            return
+
+        capacity = max(needed, 2 * len(self.first))
+        for name in ("first", "degree"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _reserve_edges(self, n):
+        np = GeometryUtils.np
+        if self.used + n <= len(self.target):
+            return
+
+        if self.used > 2 * self.live:
+            self.compact()
+            if self.used + n <= len(self.target):
+                return
+
+        capacity = max(self.used + n, 2 * len(self.target))
+        for name, fill in (("target", 0), ("twin", -1), ("next", 0), ("cell", 0), ("site", -1)):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:self.used] = old[:self.used]
+            setattr(self, name, new)
+
+    def _new_vertex(self):
+        np = GeometryUtils.np
+        if self.free:
+            return self.free.pop()
+
+        vertex = len(self.refs)
+        if vertex >= len(self.points):
+            points = np.zeros((2 * len(self.points), 2))
+            points[:vertex] = self.points
+            self.points = points
+        self.refs.append(0)
+        return vertex
+
+    def compact(self):
+        np = GeometryUtils.np
+        cells = np.flatnonzero(self.degree)
+        counts = self.degree[cells]
+        offsets = np.zeros(len(cells) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        idx = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - self.first[cells], counts)
+        remap = np.full(max(self.used, 1), -1, dtype=np.int32)
+        remap[idx] = np.arange(len(idx))
+
+        twin = self.twin[idx]
+        self.twin[:len(idx)] = np.where(twin >= 0, remap[twin], -1)
+        self.next[:len(idx)] = remap[self.next[idx]]
+        for name in ("target", "cell", "site"):
+            values = getattr(self, name)
+            values[:len(idx)] = values[idx]
+        self.first[cells] = offsets[:-1]
+        self.used = self.live = len(idx)
+
+    def _slots(self, cell_id):
+        if cell_id >= len(self.degree):
+            return 0, 0
+        return int(self.first[cell_id]), int(self.degree[cell_id])
+
+    def remove(self, cell_id):
+        lo, n = self._slots(cell_id)
+        if not n:
+            return
+
+        twins = self.twin[lo:lo + n]
+        self.twin[twins[twins >= 0]] = -1
+        self.twin[lo:lo + n] = -1
+        refs = self.refs
+        for vertex in self.target[lo:lo + n].tolist():
+            refs[vertex] -= 1
+            if not refs[vertex]:
+                self.free.append(vertex)
+        self.degree[cell_id] = 0
+        self.live -= n
+
+    def _shared_vertex(self, cell_id, incoming, outgoing, point, rings):
+        loose = incoming < 0 or outgoing < 0 or incoming == outgoing
+        x, y = point
+        tol = 1e-9 * max(1.0, abs(x), abs(y))
+        for other, before in ((incoming, True), (outgoing, False)):
+            if other not in rings:
+                continue
+            _, sites, targets = rings[other]
+            n = len(sites)
+            for j, site in enumerate(sites):
+                if site != cell_id:
+                    continue
+                if before:
+                    vertex, beside = targets[j - 1], sites[j - 1]
+                    expected = outgoing
+                else:
+                    vertex, beside = targets[j], sites[(j + 1) % n]
+                    expected = incoming
+                if beside != expected:
+                    continue
+                if loose:
+                    vx, vy = self.points[vertex].tolist()
+                    if abs(vx - x) > tol or abs(vy - y) > tol:
+                        continue
+                return vertex
+        return -1
+
+    def update(self, cell_id, ring, labels):
+        np = GeometryUtils.np
+        self.reserve_cells(cell_id + 1)
+        old_lo, old = self._slots(cell_id)
+        self.remove(cell_id)
+        n = len(ring)
+        if not n:
+            return
+
+        if n <= old:
+            lo = old_lo
+        else:
+            self._reserve_edges(n)
+            lo = self.used
+            self.used += n
+
+        ring = np.asarray(ring, dtype=float).reshape(-1, 2).tolist()
+        labels = np.asarray(labels, dtype=np.int64).tolist()
+        rings = {}
+        for site in set(labels):
+            if site >= 0 and site != cell_id:
+                other_lo, count = self._slots(site)
+                if count:
+                    rings[site] = (other_lo, self.site[other_lo:other_lo + count].tolist(),
+                                   self.target[other_lo:other_lo + count].tolist())
+
+        vertices = []
+        for k, point in enumerate(ring):
+            vertex = self._shared_vertex(cell_id, labels[k], labels[(k + 1) % n], point, rings)
+            vertices.append(vertex if vertex >= 0 else self._new_vertex())
+            self.refs[vertices[-1]] += 1
+        self.points[vertices] = ring
+
+        twins, paired = [-1] * n, []
+        for k, site in enumerate(labels):
+            if site in rings:
+                other_lo, sites, _ = rings[site]
+                if cell_id in sites:
+                    twins[k] = other_lo + sites.index(cell_id)
+                    paired.append(k)
+
+        hi = lo + n
+        self.target[lo:hi] = vertices
+        self.twin[lo:hi] = twins
+        self.next[lo:hi] = range(lo + 1, hi + 1)
+        self.next[hi - 1] = lo
+        self.cell[lo:hi] = cell_id
+        self.site[lo:hi] = labels
+        if paired:
+            self.twin[[twins[k] for k in paired]] = [lo + k for k in paired]
+        self.first[cell_id] = lo
+        self.degree[cell_id] = n
+        self.live += n
+
+    def cell_ids(self):
+        return GeometryUtils.np.flatnonzero(self.degree).tolist()
+
+    def origin(self, edge):
+        lo, n = self._slots(int(self.cell[edge]))
+        return int(self.target[lo + (edge - lo - 1) % n])
+
+    def ring(self, cell_id):
+        lo, n = self._slots(cell_id)
+        return self.points[self.target[lo:lo + n]]
+
+    def labels(self, cell_id):
+        lo, n = self._slots(cell_id)
+        return self.site[lo:lo + n].astype(GeometryUtils.np.int64)
+
+    def half_edges(self, cell_id):
+        lo, n = self._slots(cell_id)
+        return list(range(lo, lo + n))
+
+    def neighbors(self, cell_id):
+        return [site for site in self.labels(cell_id).tolist() if site >= 0]
+
+    def gather(self, cell_ids):
+        np = GeometryUtils.np
+        cell_ids = np.asarray(cell_ids, dtype=np.intp)
+        lo, counts = self.first[cell_ids], self.degree[cell_ids]
+        offsets = np.zeros(len(cell_ids) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        idx = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - lo, counts)
+        return self.points[self.target[idx]], offsets, self.site[idx].astype(np.int64)
+
+    def vertex_count(self):
+        return len(self.refs) - len(self.free)
+
+    def corner_count(self):
+        return self.live
+
+
+class MeshCellStore(CellStore):
+    def __init__(self, mesh, capacity=16):
+        super().__init__(capacity, vertex_capacity=0)
+        self.mesh = mesh
+        mesh.reserve_cells(capacity)
+
+    def _grow_cells(self, needed):
+        super()._grow_cells(needed)
+        self.mesh.reserve_cells(len(self.generators))
+
+    def set_ring(self, index, ring, labels=None):
+        np = GeometryUtils.np
+        ring = np.asarray(ring, dtype=float).reshape(-1, 2)
+        n = len(ring)
+        old = int(self.counts[index])
+        if n != old or not np.array_equal(ring, self.ring(index)):
+            self.versions[index] += 1
+
+        self.mesh.update(index, ring, [-1] * n if labels is None else labels)
+        self.counts[index] = n
+        self.live += n - old
+        self.radii[index] = np.sqrt(((ring - self.generators[index]) ** 2).sum(axis=1).max()) if n else 0.0
+
+    def ring(self, index):
+        return self.mesh.ring(index)
+
+    def ring_labels(self, index):
+        return self.mesh.labels(index)
+
+    def compact(self):
+        self.mesh.compact()
+
+    def gather(self, indices):
+        return self.mesh.gather(indices)
+
+    def scatter(self, indices, vertices, offsets, labels):
+        np = GeometryUtils.np
+        vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.intp).tolist()
+        for k, index in enumerate(np.asarray(indices, dtype=np.intp).tolist()):
+            lo, hi = offsets[k], offsets[k + 1]
+            self.set_ring(index, vertices[lo:hi], labels[lo:hi])
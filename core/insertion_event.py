@@ -0,0 +1,28 @@
+class InsertionEvent:
+    __slots__ = ("index", "point", "cell", "created", "clipped", "removed_vertices")
+
+    def __init__(self, index, point, cell, created=True, clipped=(), removed_vertices=()):
+        self.index = index
+        self.point = point
+        self.cell = cell
+        self.created = created
+        self.clipped = list(clipped)
+        self.removed_vertices = list(removed_vertices)
+
+    @classmethod
+    def from_changes(cls, index, point, cell, changed):
+        clipped = []
+        kept, removed = set(cell.polygon), {}
+        for other, old in changed:
+            old = [tuple(p) for p in old.tolist()]
+            new = other.polygon
+            clipped.append((other, old, new))
+            kept.update(new)
+            for v in old:
+                removed.setdefault(v, None)
+        removed = [v for v in removed if v not in kept]
+        return cls(index, point, cell, True, clipped, removed)
+
+    def __repr__(self):
+        return (f"InsertionEvent(index={self.index}, point={self.point}, created={self.created}, "
+                f"clipped={len(self.clipped)}, removed_vertices={len(self.removed_vertices)})")
@@ -0,0 +1,91 @@
+from core.geometry_utils import GeometryUtils
+
+
+class InsertionOrder:
+    ORDERS = ("hilbert", "zorder", "brio")
+
+    @staticmethod
+    def _quantize(points, bits):
+        np = GeometryUtils.np
+        pts = GeometryUtils.to_points(points).reshape(-1, 2)
+        lo = pts.min(axis=0)
+        span = (pts.max(axis=0) - lo).max()
+        if span == 0:
+            span = 1.0
+        scale = ((1 << bits) - 1) / span
+        q = ((pts - lo) * scale).astype(np.int64)
+        return q[:, 0], q[:, 1]
+
+    @staticmethod
+    def hilbert_keys(points, bits=16):
+        np = GeometryUtils.np
+        x, y = InsertionOrder._quantize(points, bits)
+        n = 1 << bits
+        d = np.zeros(len(x), dtype=np.int64)
+
+        s = n >> 1
+        while s > 0:
+            rx = (x & s) > 0
+            ry = (y & s) > 0
+            d += s * s * ((3 * rx) ^ ry)
+
+            flip = ~ry & rx
+            x = np.where(flip, n - 1 - x, x)
+            y = np.where(flip, n - 1 - y, y)
+            swap = ~ry
+            x, y = np.where(swap, y, x), np.where(swap, x, y)
+            s >>= 1
+
+        return d
+
+    @staticmethod
+    def zorder_keys(points, bits=16):
+        x, y = InsertionOrder._quantize(points, bits)
+
+        def spread(v):
+            v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+            v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+            v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+            v = (v | (v << 2)) & 0x3333333333333333
+            v = (v | (v << 1)) & 0x5555555555555555
+            return v
+
+        return spread(x) | (spread(y) << 1)
+
+    @staticmethod
+    def hilbert(points):
+        np = GeometryUtils.np
+        return np.argsort(InsertionOrder.hilbert_keys(points), kind="stable")
+
+    @staticmethod
+    def zorder(points):
+        np = GeometryUtils.np
+        return np.argsort(InsertionOrder.zorder_keys(points), kind="stable")
+
+    @staticmethod
+    def brio(points, seed=None):
+        np = GeometryUtils.np
+        pts = GeometryUtils.to_points(points).reshape(-1, 2)
+        n = len(pts)
+        shuffled = np.random.default_rng(seed).permutation(n)
+        keys = InsertionOrder.hilbert_keys(pts) if n else np.zeros(0, dtype=np.int64)
+
+        rounds = []
+        end = n
+        while end > 0:
+            start = end // 2 if end > 16 else 0
+            rounds.append(shuffled[start:end])
+            end = start
+
+        order = [r[np.argsort(keys[r], kind="stable")] for r in reversed(rounds)]
+        return np.concatenate(order) if order else np.zeros(0, dtype=np.intp)
+
+    @staticmethod
+    def permutation(points, order, seed=None):
+        if order == "hilbert":
+            return InsertionOrder.hilbert(points)
+        if order == "zorder":
+            return InsertionOrder.zorder(points)
+        if order == "brio":
+            return InsertionOrder.brio(points, seed)
+        raise ValueError(f"unknown insertion order: {order!r}")
@@ -0,0 +1,82 @@
+from fractions import Fraction
+
+from core.geometry_utils import GeometryUtils
+
+EPS = 2.0 ** -53
+
+
+class Predicates:
+    SIDE_BOUND = 4.0 * EPS
+    ORIENT_BOUND = (3.0 + 16.0 * EPS) * EPS
+    exact_calls = 0
+
+    @staticmethod
+    def _sign(v):
+        return (v > 0) - (v < 0)
+
+    @staticmethod
+    def side_exact(point, line):
+        Predicates.exact_calls += 1
+        a, b, c = map(Fraction, line)
+        x, y = map(Fraction, point)
+        return Predicates._sign(a*x + b*y + c)
+
+    @staticmethod
+    def side_value(point, line):
+        a, b, c = line
+        x, y = point
+        ax, by = a*x, b*y
+        v = ax + by + c
+        if abs(v) > Predicates.SIDE_BOUND * (abs(ax) + abs(by) + abs(c)):
+            return (1 if v > 0 else -1), v
+        return Predicates.side_exact((x, y), line), v
+
+    @staticmethod
+    def side(point, line):
+        return Predicates.side_value(point, line)[0]
+
+    @staticmethod
+    def side_values(points, lines):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        lines = np.asarray(lines, dtype=float).reshape(-1, 3)
+        ax = lines[:, 0] * pts[:, 0]
+        by = lines[:, 1] * pts[:, 1]
+        c = lines[:, 2]
+        v = ax + by + c
+
+        signs = np.sign(v).astype(np.int8)
+        uncertain = np.flatnonzero(np.abs(v) <= Predicates.SIDE_BOUND * (np.abs(ax) + np.abs(by) + np.abs(c)))
+        for i in uncertain.tolist():
+            signs[i] = Predicates.side_exact(pts[i].tolist(), lines[i].tolist())
+        return signs, v
+
+    @staticmethod
+    def sides(points, lines):
+        return Predicates.side_values(points, lines)[0]
+
+    @staticmethod
+    def crossing(p1, p2, v1, v2):
+        t = v1 / (v1 - v2) if v1 != v2 else 0.5
+        t = min(max(t, 0.0), 1.0)
+        return (p1[0] + t*(p2[0] - p1[0]), p1[1] + t*(p2[1] - p1[1]))
+
+    @staticmethod
+    def orient2d_exact(a, b, c):
+        Predicates.exact_calls += 1
+        ax, ay = map(Fraction, a)
+        bx, by = map(Fraction, b)
+        cx, cy = map(Fraction, c)
+        return Predicates._sign((bx - ax)*(cy - ay) - (by - ay)*(cx - ax))
+
+    @staticmethod
+    def orient2d(a, b, c):
+        ax, ay = a
+        bx, by = b
+        cx, cy = c
+        left = (bx - ax)*(cy - ay)
+        right = (by - ay)*(cx - ax)
+        det = left - right
+        if abs(det) > Predicates.ORIENT_BOUND * (abs(left) + abs(right)):
+            return 1 if det > 0 else -1
+        return Predicates.orient2d_exact(a, b, c)
@@ -1,5 +1,8 @@
+from core.geometry_backend import BACKENDS
+
+
 class ShapelyHelper:
-    def __init__(self):
+    def __init__(self, backend=None):
         try:
             from shapely.geometry import Point, LineString, Polygon
             from shapely.ops import split
@@ -14,3 +17,15 @@ class ShapelyHelper:
             self.Polygon = None
             self.split = None
             self.has_shapely = False
+
+        if backend is None:
+            backend = "shapely" if self.has_shapely else "numpy"
+            try:
+                self.backend = BACKENDS[backend](self)
+            except ImportError:
+                self.backend = BACKENDS["numpy"](self)
+            return
+
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown geometry backend: {backend!r}")
+        self.backend = BACKENDS[backend](self)
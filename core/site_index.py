@@ -0,0 +1,132 @@
+import math
+
+
+class SiteIndex:
+    def __init__(self, bbox, sites_per_bucket=2):
+        self.bbox = float(bbox)
+        self.sites_per_bucket = sites_per_bucket
+        self.points = {}
+        self._reset_grid(1)
+
+    def _reset_grid(self, size):
+        self.size = size
+        if self.points:
+            xs = [p[0] for p in self.points.values()]
+            ys = [p[1] for p in self.points.values()]
+            cx, cy = (min(xs) + max(xs)) / 2.0, (min(ys) + max(ys)) / 2.0
+            span = max(max(xs) - min(xs), max(ys) - min(ys))
+            half = 0.75 * span or max(abs(cx), abs(cy), 1.0) * 1e-9
+        else:
+            cx = cy = 0.0
+            half = self.bbox
+        self.origin = (cx - half, cy - half)
+        self.cell = 2.0 * half / size
+        self.buckets = {}
+        for site_id, p in self.points.items():
+            self.buckets.setdefault(self._key(p), []).append(site_id)
+
+    def _coord(self, v, axis):
+        i = int((v - self.origin[axis]) // self.cell)
+        return min(max(i, 0), self.size - 1)
+
+    def _key(self, p):
+        return (self._coord(p[0], 0), self._coord(p[1], 1))
+
+    def _covers(self, p):
+        x0, y0 = self.origin
+        extent = self.size * self.cell
+        return x0 <= p[0] <= x0 + extent and y0 <= p[1] <= y0 + extent
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, site_id):
+        return site_id in self.points
+
+    def clear(self):
+        self.points = {}
+        self._reset_grid(1)
+
+    def insert(self, site_id, point):
+        p = (float(point[0]), float(point[1]))
+        self.points[site_id] = p
+
+        wanted = math.isqrt(len(self.points) // self.sites_per_bucket)
+        if wanted >= 2 * self.size:
+            self._reset_grid(wanted)
+        elif not self._covers(p) or len(self.points) == 1:
+            self._reset_grid(self.size)
+        else:
+            self.buckets.setdefault(self._key(p), []).append(site_id)
+
+    def remove(self, site_id):
+        p = self.points.pop(site_id)
+        key = self._key(p)
+        bucket = self.buckets[key]
+        bucket.remove(site_id)
+        if not bucket:
+            del self.buckets[key]
+
+    def move(self, site_id, point):
+        self.remove(site_id)
+        self.insert(site_id, point)
+
+    def _ring(self, cx, cy, r):
+        if r == 0:
+            yield (cx, cy)
+            return
+        for ix in range(cx - r, cx + r + 1):
+            yield (ix, cy - r)
+            yield (ix, cy + r)
+        for iy in range(cy - r + 1, cy + r):
+            yield (cx - r, iy)
+            yield (cx + r, iy)
+
+    def find_within(self, point, eps):
+        x, y = float(point[0]), float(point[1])
+        eps2 = eps * eps
+        i0, i1 = self._coord(x - eps, 0), self._coord(x + eps, 0)
+        j0, j1 = self._coord(y - eps, 1), self._coord(y + eps, 1)
+
+        for ix in range(i0, i1 + 1):
+            for iy in range(j0, j1 + 1):
+                for site_id in self.buckets.get((ix, iy), ()):
+                    sx, sy = self.points[site_id]
+                    if (sx - x)**2 + (sy - y)**2 < eps2:
+                        return site_id
+        return None
+
+    def within(self, point, radius):
+        x, y = float(point[0]), float(point[1])
+        r2 = radius * radius
+        i0, i1 = self._coord(x - radius, 0), self._coord(x + radius, 0)
+        j0, j1 = self._coord(y - radius, 1), self._coord(y + radius, 1)
+
+        found = []
+        for ix in range(i0, i1 + 1):
+            for iy in range(j0, j1 + 1):
+                for site_id in self.buckets.get((ix, iy), ()):
+                    sx, sy = self.points[site_id]
+                    if (sx - x)**2 + (sy - y)**2 <= r2:
+                        found.append(site_id)
+        return found
+
+    def nearest(self, point):
+        if not self.points:
+            return None
+
+        x, y = float(point[0]), float(point[1])
+        cx, cy = self._key((x, y))
+        best, best_d = None, float("inf")
+
+        for r in range(self.size + 1):
+            for key in self._ring(cx, cy, r):
+                for site_id in self.buckets.get(key, ()):
+                    sx, sy = self.points[site_id]
+                    d = (sx - x)**2 + (sy - y)**2
+                    if d < best_d:
+                        best, best_d = site_id, d
+            if best is not None and best_d <= (r * self.cell)**2:
+                break
+
+        return best
@@ -0,0 +1,137 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from core.geometry_utils import GeometryUtils
+
+_worker = {}
+
+
+def _init_worker(join, path):
+    _worker["join"] = join
+    _worker["points"] = None if path is None else GeometryUtils.np.load(path, mmap_mode="r")
+
+
+def _assign_chunk(task):
+    start, stop, points = task
+    if points is None:
+        points = _worker["points"][start:stop]
+    return _worker["join"].assign(points)
+
+
+class SpatialJoin:
+    def __init__(self, bbox, generators, vertices, offsets):
+        np = GeometryUtils.np
+        self.bbox = float(bbox)
+        self.generators = np.asarray(generators, dtype=float).reshape(-1, 2)
+
+        n = len(self.generators)
+        self.size = max(1, math.isqrt(n))
+        if n:
+            self.origin = self.generators.min(axis=0)
+            span = self.generators.max(axis=0) - self.origin
+        else:
+            self.origin = span = np.zeros(2)
+        self.width = np.where(span > 0, span / self.size, 1.0)
+
+        counts = np.diff(offsets)
+        cells = np.flatnonzero(counts > 0)
+        if len(cells):
+            starts = np.asarray(offsets)[cells]
+            lo = np.minimum.reduceat(vertices, starts)
+            hi = np.maximum.reduceat(vertices, starts)
+        else:
+            lo = hi = np.zeros((0, 2))
+
+        ix0, iy0 = self._bucket(lo[:, 0], 0), self._bucket(lo[:, 1], 1)
+        nx = self._bucket(hi[:, 0], 0) - ix0 + 1
+        ny = self._bucket(hi[:, 1], 1) - iy0 + 1
+        spans = nx * ny
+        first = np.repeat(np.cumsum(spans) - spans, spans)
+        local = np.arange(int(spans.sum())) - first
+        width = np.repeat(nx, spans)
+        buckets = (np.repeat(iy0, spans) + local // width) * self.size + np.repeat(ix0, spans) + local % width
+        owners = np.repeat(cells, spans)
+
+        order = np.argsort(buckets, kind="stable")
+        buckets, owners = buckets[order], owners[order]
+        per_bucket = np.bincount(buckets, minlength=self.size * self.size)
+        rank = np.arange(len(buckets)) - np.repeat(np.cumsum(per_bucket) - per_bucket, per_bucket)
+
+        self.fill = per_bucket
+        self.table = np.full((self.size * self.size, max(1, int(per_bucket.max(initial=0)))), -1, dtype=np.int32)
+        self.table[buckets, rank] = owners
+
+    @classmethod
+    def from_diagram(cls, diagram):
+        np = GeometryUtils.np
+        indices = np.array([cell.index for cell in diagram.cells], dtype=np.intp)
+        vertices, offsets, _ = diagram.store.gather(indices)
+        return cls(diagram.bbox, diagram.store.generators[indices], vertices, offsets)
+
+    def _bucket(self, v, axis):
+        np = GeometryUtils.np
+        return np.clip(((v - self.origin[axis]) // self.width[axis]).astype(np.int64), 0, self.size - 1)
+
+    def assign(self, points):
+        np = GeometryUtils.np
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        owner = np.full(len(pts), -1, dtype=np.int32)
+
+        b = self.bbox
+        inside = np.flatnonzero((np.abs(pts[:, 0]) <= b) & (np.abs(pts[:, 1]) <= b))
+        if not len(inside) or not len(self.generators):
+            return owner
+
+        keys = self._bucket(pts[inside, 1], 1) * self.size + self._bucket(pts[inside, 0], 0)
+        fill = self.fill[keys]
+        order = np.argsort(-fill, kind="stable")
+        inside, keys, fill = inside[order], keys[order], -fill[order]
+        q = pts[inside]
+
+        best = np.full(len(q), np.inf)
+        found = np.full(len(q), -1, dtype=np.int32)
+        for col in range(-int(fill[0])):
+            m = int(np.searchsorted(fill, -col, side="left"))
+            candidates = self.table[keys[:m], col]
+            d = ((self.generators[candidates] - q[:m]) ** 2).sum(axis=1)
+            closer = np.flatnonzero(d < best[:m])
+            best[closer] = d[closer]
+            found[closer] = candidates[closer]
+
+        owner[inside] = found
+        return owner
+
+    def run(self, points, chunk_size=262144, workers=None, executor="thread"):
+        np = GeometryUtils.np
+        if executor not in ("thread", "process"):
+            raise ValueError(f"unknown executor: {executor!r}")
+
+        path = None
+        if isinstance(points, (str, os.PathLike)):
+            path = os.fspath(points)
+            points = np.load(path, mmap_mode="r")
+        elif not isinstance(points, np.ndarray):
+            points = np.asarray(points, dtype=float).reshape(-1, 2)
+
+        n = len(points)
+        owner = np.full(n, -1, dtype=np.int32)
+        spans = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(spans) <= 1:
+            for start, stop in spans:
+                owner[start:stop] = self.assign(points[start:stop])
+        elif executor == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                chunks = pool.map(lambda span: self.assign(points[span[0]:span[1]]), spans)
+                for (start, stop), chunk in zip(spans, chunks):
+                    owner[start:stop] = chunk
+        else:
+            tasks = [(start, stop, None if path else np.asarray(points[start:stop])) for start, stop in spans]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self, path)) as pool:
+                for (start, stop), chunk in zip(spans, pool.map(_assign_chunk, tasks)):
+                    owner[start:stop] = chunk
+
+        return owner
@@ -1,12 +1,73 @@
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 from core.cell import Cell
+from core.cell_store import CellStore
+from core.fortune import FortuneSweep
+from core.insertion_event import InsertionEvent
+from core.insertion_order import InsertionOrder
 from core.geometry_utils import GeometryUtils
+from core.half_edge_mesh import HalfEdgeMesh, MeshCellStore
+from core.site_index import SiteIndex
+from core.spatial_join import SpatialJoin
+
+
+def _build_tile(task):
+    helper_cls, backend, geometry_cls, bbox, engine, points, owned, region = task
+    sh = helper_cls(backend)
+    vd = VoronoiDiagram(sh, geometry_cls(sh), bbox=bbox, engine=engine)
+    vd.incremental_voronoi(points.tolist())
+
+    np = GeometryUtils.np
+    vertices, offsets, labels = vd.store.gather(np.arange(owned))
+    counts = np.diff(offsets)
+    radius = GeometryUtils.dist(vertices, np.repeat(points[:owned], counts, axis=0))
+
+    x0, y0, x1, y1 = region
+    inside = ((vertices[:, 0] - radius >= x0) & (vertices[:, 0] + radius <= x1) &
+              (vertices[:, 1] - radius >= y0) & (vertices[:, 1] + radius <= y1))
+    outside = np.bincount(np.repeat(np.arange(owned), counts), weights=~inside, minlength=owned)
+    return vertices, offsets, labels, outside == 0
 
 class VoronoiDiagram:
-    def __init__(self, shapely_helper, voronoi_geo, bbox=10000):
+    def __init__(self, shapely_helper, voronoi_geo, bbox=10000, insertion="walk", engine="incremental",
+                 half_edges=False):
+        if insertion not in ("walk", "brute"):
+            raise ValueError(f"unknown insertion mode: {insertion!r}")
+        if engine not in ("incremental", "sweep"):
+            raise ValueError(f"unknown engine: {engine!r}")
+
         self.cells = []
         self.sh = shapely_helper
         self.vg = voronoi_geo
         self.bbox = bbox
+        self.insertion = insertion
+        self.engine = engine
+        self.weld_eps = 2.0 ** -40
+        self.move_stats = {"fast": 0, "slow": 0}
+        self.tile_stats = {"tiles": 0, "sites": 0, "rebuilt": 0}
+        self.locate_stats = {"walks": 0, "steps": 0, "fallbacks": 0}
+        self._last_located = None
+        self.listeners = []
+        self.mesh = HalfEdgeMesh() if half_edges else None
+        self.store = self._new_store()
+        self.index = SiteIndex(bbox)
+        self._sites = {}
+        self._positions = {}
+        self._outside = set()
+
+    def _new_store(self):
+        return CellStore() if self.mesh is None else MeshCellStore(self.mesh)
+
+    def _append_cell(self, cell):
+        self._positions[cell.site_id] = len(self.cells)
+        self.cells.append(cell)
+
+    def _reindex_cells(self):
+        self._positions = {cell.site_id: i for i, cell in enumerate(self.cells)}
 
     def initial_polygon(self):
         b = self.bbox
@@ -25,51 +86,602 @@ class VoronoiDiagram:
         return (a, b, c)
 
     def choose_halfplane_side(self, new_point, bisector):
-        new_p = GeometryUtils.to_np(new_point)
         line = self.line_equation(bisector)
-        val = self.vg.signed_distance_to_line(new_p, line)
+        val = self.vg.signed_distance_to_line(GeometryUtils.as_xy(new_point), line)
         return val >= 0
 
-    def insert_site(self, point):
-        
-        new_cell = Cell(
+    def cell_by_id(self, site_id):
+        return self._sites.get(site_id)
+
+    def cell_at(self, point, eps=1e-10):
+        site_id = self.index.find_within(point, eps)
+        return None if site_id is None else self._sites[site_id]
+
+    def _new_cell(self, point):
+        cell = Cell(
             point,
             polygon=self.initial_polygon(),
             shapely_helper=self.sh,
-            voronoi_geo=self.vg
+            voronoi_geo=self.vg,
+            store=self.store
         )
-        
-        for existing_cell in self.cells:
-            dist = GeometryUtils.dist(existing_cell.generator, point)
-            if dist < 1e-10:
-                return existing_cell
-
-        for cell in self.cells:
-            if not cell.polygon:
+        return cell
+
+    def _in_bbox(self, point):
+        b = self.bbox
+        return -b <= point[0] <= b and -b <= point[1] <= b
+
+    def _culled(self, cell, point):
+        gx, gy = cell.generator
+        reach = GeometryUtils.dist((gx, gy), point) - 2.0 * self.store.radii[cell.index]
+        if reach > self.weld_eps * (abs(gx) + abs(gy) + abs(point[0]) + abs(point[1])):
+            self.store.culled += 1
+            return True
+        return False
+
+    def _loses_region(self, cell, line):
+        for v in cell.polygon:
+            if self.vg.signed_distance_to_line(v, line) < 0:
+                return True
+        return False
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _emit(self, index, point, cell, changed):
+        if not self.listeners:
+            return
+        if changed is None:
+            event = InsertionEvent(index, point, cell, created=False)
+        else:
+            event = InsertionEvent.from_changes(index, point, cell, changed)
+        for listener in list(self.listeners):
+            listener(event)
+
+    def insert_site(self, point):
+        return self._insert(point)[0]
+
+    def _insert(self, point, index=None):
+        point = tuple(map(float, point))
+
+        existing = self.cell_at(point)
+        if existing is not None:
+            self._emit(index, point, existing, None)
+            return existing, []
+
+        new_cell = self._new_cell(point)
+        changed = self._attach(new_cell)
+        self._append_cell(new_cell)
+        self._emit(index, point, new_cell, changed)
+        return new_cell, changed
+
+    def _attach(self, new_cell, start=None):
+        point = new_cell.generator
+        if self.insertion == "walk" and self._sites and self._in_bbox(point):
+            changed = self._insert_walk(new_cell, point, start)
+        else:
+            changed = self._insert_brute(new_cell, point)
+
+        self._sites[new_cell.site_id] = new_cell
+        self.index.insert(new_cell.site_id, point)
+        if not self._in_bbox(point):
+            self._outside.add(new_cell.site_id)
+        return changed
+
+    def _insert_walk(self, new_cell, point, start=None):
+        if start is None:
+            start = self._sites[self.index.nearest(point)]
+        queue = deque([start])
+        seen = {start.site_id}
+        changed = []
+
+        while queue:
+            cell = queue.popleft()
+            if self._culled(cell, point):
+                continue
+
+            line = self.vg.bisector_coefficients(cell.generator, point)
+            if not self._loses_region(cell, line):
                 continue
 
-            bisector = self.vg.perpendicular_bisector(cell.generator, point)
-            line = self.line_equation(bisector)
+            for nid in cell.neighbor_ids():
+                if nid not in seen:
+                    seen.add(nid)
+                    queue.append(self._sites[nid])
 
-            keep_positive_for_old = self.choose_halfplane_side(
-                new_point=cell.generator,
-                old_point=point,
-                bisector=bisector
-            )
+            changed.append((cell, self.store.ring(cell.index).copy()))
+            cell.clip_with_halfplane(line, True, new_cell.site_id, self.weld_eps)
+            new_cell.clip_with_halfplane(line, False, cell.site_id, self.weld_eps)
+            self.store.clipped += 1
+
+        return changed
+
+    def _insert_brute(self, new_cell, point):
+        np = GeometryUtils.np
+        targets = [cell for cell in self._sites.values() if cell.polygon]
+        if not targets:
+            return []
+
+        indices = np.array([cell.index for cell in targets], dtype=np.intp)
+        dist = GeometryUtils.dist(self.store.generators[indices], point)
+        tol = self.weld_eps * (np.abs(self.store.generators[indices]).sum(axis=1) + abs(point[0]) + abs(point[1]))
+        hit = (dist - 2.0 * self.store.radii[indices] <= tol).tolist()
+        self.store.culled += len(targets) - sum(hit)
 
-            cell.clip_with_halfplane(line, keep_positive_for_old)
-            new_cell.clip_with_halfplane(line, not keep_positive_for_old)
+        order = np.argsort(dist, kind="stable").tolist()
+        lines = self.vg.bisector_coefficients(self.store.generators[indices], point)
+        for k in order:
+            if dist[k] - 2.0 * self.store.radii[new_cell.index] > tol[k]:
+                self.store.culled += 1
+                continue
+            new_cell.clip_with_halfplane(lines[k].tolist(), False, targets[k].site_id, self.weld_eps)
+
+        targets = [cell for cell, h in zip(targets, hit) if h]
+        if not targets:
+            return []
+        indices = indices[hit]
+        lines = lines[hit]
 
-        self.cells.append(new_cell)
-        return new_cell
+        versions = self.store.versions[indices].copy()
+        old, offsets, _ = self.store.gather(indices)
+        self._clip_cells(targets, lines, True, new_cell.site_id)
 
-    def incremental_voronoi(self, points, callback=None):
+        clipped = (self.store.versions[indices] != versions).tolist()
+        return [
+            (cell, old[offsets[k]:offsets[k + 1]])
+            for k, (cell, hit) in enumerate(zip(targets, clipped)) if hit
+        ]
+
+    def insert_sites(self, points, seed=None):
+        np = GeometryUtils.np
         pts = [tuple(map(float, p)) for p in points]
+        result = [None] * len(pts)
+        if not pts:
+            return result
+
+        order = np.random.default_rng(seed).permutation(len(pts)).tolist()
+        inside = [self._in_bbox(p) for p in pts]
+        first = len(self.cells)
+
+        if not self._sites:
+            k = next((k for k in order if inside[k]), order[0])
+            order.remove(k)
+            result[k] = self._insert(pts[k], k)[0]
+
+        conflicts = {}
+        for k in order:
+            if inside[k]:
+                conflicts.setdefault(self.index.nearest(pts[k]), []).append(k)
+        owner = {k: site_id for site_id, ks in conflicts.items() for k in ks}
+
+        for k in order:
+            p = pts[k]
+            if inside[k]:
+                start = self._sites[owner[k]]
+                existing = start if GeometryUtils.dist(start.generator, p) < 1e-10 else None
+            else:
+                start = None
+                existing = self.cell_at(p)
+            if existing is not None:
+                result[k] = existing
+                self._emit(k, p, existing, None)
+                continue
+
+            new_cell = self._new_cell(p)
+            changed = self._attach(new_cell, start)
+            self._append_cell(new_cell)
+            result[k] = new_cell
+            self._emit(k, p, new_cell, changed)
+
+            moved = []
+            for cell, _ in changed:
+                pending = conflicts.pop(cell.site_id, ())
+                if not pending:
+                    continue
+                gx, gy = cell.generator
+                stay = []
+                for j in pending:
+                    if result[j] is not None:
+                        continue
+                    x, y = pts[j]
+                    if (x - p[0])**2 + (y - p[1])**2 < (x - gx)**2 + (y - gy)**2:
+                        moved.append(j)
+                    else:
+                        stay.append(j)
+                if stay:
+                    conflicts[cell.site_id] = stay
+
+            if moved:
+                conflicts[new_cell.site_id] = moved
+                for j in moved:
+                    owner[j] = new_cell.site_id
+
+        position = {}
+        for k, cell in enumerate(result):
+            position.setdefault(cell.site_id, k)
+        self.cells[first:] = sorted(self.cells[first:], key=lambda cell: position[cell.site_id])
+        self._reindex_cells()
+        return result
+
+    def _clip_cells(self, cells, lines, keeps, site_id):
+        indices = [cell.index for cell in cells]
+        vertices, offsets, labels = self.store.gather(indices)
+
+        out, out_offsets, out_labels = self.vg.clip_many(
+            vertices, offsets, lines, keeps, labels, site_id, self.weld_eps
+        )
+        self.store.scatter(indices, out, out_offsets, out_labels)
+        self.store.clipped += len(cells)
+
+    def _resolve(self, site):
+        if isinstance(site, Cell):
+            cell = self._sites.get(site.site_id)
+            cell = cell if cell is site else None
+        elif isinstance(site, (int, GeometryUtils.np.integer)):
+            cell = self._sites.get(int(site))
+        else:
+            cell = self.cell_at(GeometryUtils.as_xy(site))
+
+        if cell is None:
+            raise KeyError(f"no site {site!r} in the diagram")
+        return cell
+
+    def _rebuild_cell(self, cell, candidates, polygon=None, labels=None):
+        if polygon is None:
+            polygon = self.initial_polygon()
+            labels = [-1] * len(polygon)
+        for site_id in candidates:
+            line = self.vg.bisector_coefficients(cell.generator, self._sites[site_id].generator)
+            polygon, labels = self.vg.clip_labeled_polygon(
+                polygon, labels, line, True, site_id, self.weld_eps
+            )
+        cell.update_polygon(polygon, labels)
+
+    def _detach(self, cell):
+        del self._sites[cell.site_id]
+        self.index.remove(cell.site_id)
+        self._outside.discard(cell.site_id)
+
+        heirs = cell.neighbor_ids()
+        near = self.index.within(cell.generator, 2.0 * cell.radius) if heirs else self._outside
+        heirs |= {s for s in near if s in self._outside and not self._sites[s].polygon}
+        for site_id in heirs:
+            other = self._sites[site_id]
+            candidates = sorted((other.neighbor_ids() | heirs) - {cell.site_id, site_id})
+            if other.polygon:
+                self._rebuild_cell(other, candidates)
+            else:
+                self._rebuild_cell(other, candidates, cell.polygon, cell.edge_sites)
+
+    def remove_site(self, site):
+        cell = self._resolve(site)
+        self._detach(cell)
+        position = self._positions.pop(cell.site_id)
+        last = self.cells.pop()
+        if last is not cell:
+            self.cells[position] = last
+            self._positions[last.site_id] = position
+        self.store.views.pop(cell.site_id, None)
+        cell.update_polygon(None)
+        return cell
+
+    def _owns_vertices(self, cell):
+        for v in cell.polygon:
+            nearest = self._sites[self.index.nearest(v)]
+            if nearest is not cell:
+                own = GeometryUtils.dist(v, cell.generator)
+                tol = 10 * self.weld_eps * (abs(v[0]) + abs(v[1]) + own)
+                if GeometryUtils.dist(v, nearest.generator) < own - tol:
+                    return False
+        return True
+
+    def move_site(self, site, point):
+        cell = self._resolve(site)
+        point = tuple(map(float, point))
+        old_point = cell.generator
+
+        existing = self.cell_at(point)
+        if existing is cell:
+            return cell
+        if existing is not None:
+            raise ValueError(f"another site already exists at {point}")
+
+        neighbors = [self._sites[site_id] for site_id in sorted(cell.neighbor_ids())]
+        if self._in_bbox(point) and self._in_bbox(old_point):
+            saved = [(c, c.polygon, c.edge_sites) for c in [cell] + neighbors]
+
+            self.store.generators[cell.index] = point
+            self.index.move(cell.site_id, point)
+            for c in [cell] + neighbors:
+                self._rebuild_cell(c, sorted(c.neighbor_ids()))
+
+            if all(self._owns_vertices(c) for c in [cell] + neighbors):
+                self.move_stats["fast"] += 1
+                return cell
+
+            self.store.generators[cell.index] = old_point
+            for c, polygon, labels in saved:
+                c.update_polygon(polygon, labels)
+            self.index.move(cell.site_id, old_point)
+
+        self.move_stats["slow"] += 1
+        self._detach(cell)
+        self.store.generators[cell.index] = point
+        cell.update_polygon(self.initial_polygon())
+        self._attach(cell)
+        return cell
+
+    def _walk_start(self, hint):
+        for cell in (hint, self._last_located):
+            if cell is None:
+                continue
+            if not isinstance(cell, Cell):
+                cell = self._sites.get(int(cell))
+            if cell is not None and self._sites.get(cell.site_id) is cell and cell.polygon:
+                return cell
+        return None
+
+    def locate(self, point, hint=None):
+        point = GeometryUtils.as_xy(point)
+        if not self._sites or not self._in_bbox(point):
+            return None
+
+        cell = self._walk_start(hint)
+        best = math.inf if cell is None else GeometryUtils.dist(cell.generator, point)
+        if cell is None or best > 2.0 * cell.radius:
+            self.locate_stats["fallbacks"] += 1
+            cell = self._sites[self.index.nearest(point)]
+            best = GeometryUtils.dist(cell.generator, point)
+
+        while True:
+            step, step_d = None, best
+            for site_id in cell.neighbor_ids():
+                other = self._sites[site_id]
+                d = GeometryUtils.dist(other.generator, point)
+                if d < step_d:
+                    step, step_d = other, d
+            if step is None:
+                break
+            cell, best = step, step_d
+            self.locate_stats["steps"] += 1
+
+        self.locate_stats["walks"] += 1
+        self._last_located = cell
+        return cell
+
+    def vertex_stats(self):
+        np = GeometryUtils.np
+        indices = np.array([cell.index for cell in self.cells], dtype=np.intp)
+        vertices, offsets, labels = self.store.gather(indices)
+        counts = np.diff(offsets)
+
+        nxt = np.arange(1, len(vertices) + 1)
+        nonempty = counts > 0
+        nxt[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+        nxt %= max(len(vertices), 1)
+        repeated = (labels >= 0) & (labels == labels[nxt])
+        scale = np.zeros(len(counts))
+        if len(vertices):
+            scale[nonempty] = np.maximum.reduceat(np.abs(vertices).max(axis=1), offsets[:-1][nonempty])
+        tol = self.weld_eps * np.repeat(scale, counts)
+        welded = (np.abs(vertices - vertices[nxt]) <= tol[:, None]).all(axis=1)
+
+        return {
+            "cells": len(self.cells),
+            "vertices": int(counts.sum()),
+            "max": int(counts.max(initial=0)),
+            "redundant": int((repeated | welded).sum()),
+            **self.vg.vertex_stats,
+        }
+
+    def adjacency(self):
+        np = GeometryUtils.np
+        n = len(self.cells)
+        indices = np.array([cell.index for cell in self.cells], dtype=np.intp)
+        _, offsets, labels = self.store.gather(indices)
+
+        position = np.full(len(self.store), -1, dtype=np.int64)
+        position[indices] = np.arange(n)
+        rows = np.repeat(np.arange(n), np.diff(offsets))
+        cols = np.where(labels >= 0, position[np.maximum(labels, 0)], -1)
+
+        keep = cols >= 0
+        pairs = np.unique(rows[keep] * n + cols[keep])
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pairs // n, minlength=n), out=indptr[1:])
+        return indptr, pairs % n
+
+    def locate_many(self, points):
+        return self.sh.backend.locate_many(self, points)
+
+    def spatial_join(self, points, chunk_size=262144, workers=None, executor="thread"):
+        return SpatialJoin.from_diagram(self).run(points, chunk_size, workers, executor)
+
+    def _sweep(self, pts):
+        for p in pts:
+            if self.cell_at(p) is not None:
+                continue
+            cell = self._new_cell(p)
+            self._sites[cell.site_id] = cell
+            self.index.insert(cell.site_id, p)
+            if not self._in_bbox(p):
+                self._outside.add(cell.site_id)
+            self._append_cell(cell)
+
+        neighbors = [[] for _ in self.cells]
+        for i, j in FortuneSweep([cell.generator for cell in self.cells]).neighbor_pairs():
+            neighbors[i].append(self.cells[j].site_id)
+            neighbors[j].append(self.cells[i].site_id)
+
+        for cell, candidates in zip(self.cells, neighbors):
+            self._rebuild_cell(cell, sorted(candidates))
+
+    def _reset(self):
         self.cells = []
+        self._positions = {}
+        if self.mesh is not None:
+            self.mesh.clear()
+        self.store = self._new_store()
+        self.index.clear()
+        self._sites = {}
+        self._outside = set()
+
+    def _tiles(self, generators, k, margin):
+        np = GeometryUtils.np
+        lo = generators.min(axis=0)
+        span = generators.max(axis=0) - lo
+        wx, wy = np.where(span > 0, span / k, 1.0).tolist()
+        owner = np.clip(((generators - lo) // (wx, wy)).astype(np.intp), 0, k - 1)
+
+        for i in range(k):
+            for j in range(k):
+                x0, y0 = lo[0] + i * wx, lo[1] + j * wy
+                region = (
+                    x0 - margin if i > 0 else -math.inf,
+                    y0 - margin if j > 0 else -math.inf,
+                    x0 + wx + margin if i < k - 1 else math.inf,
+                    y0 + wy + margin if j < k - 1 else math.inf,
+                )
+                owned = (owner[:, 0] == i) & (owner[:, 1] == j)
+                near = ((generators[:, 0] >= region[0]) & (generators[:, 0] <= region[2]) &
+                        (generators[:, 1] >= region[1]) & (generators[:, 1] <= region[3]))
+                ids = np.concatenate([np.flatnonzero(owned), np.flatnonzero(near & ~owned)])
+                if owned.any():
+                    yield ids, int(owned.sum()), region
+
+    def parallel_voronoi(self, points, workers=None, tiles=None, margin=None):
+        np = GeometryUtils.np
+        self._reset()
+        for p in points:
+            p = tuple(map(float, p))
+            if self.cell_at(p) is not None:
+                continue
+            cell = Cell(p, shapely_helper=self.sh, voronoi_geo=self.vg, store=self.store)
+            self._sites[cell.site_id] = cell
+            self.index.insert(cell.site_id, p)
+            if not self._in_bbox(p):
+                self._outside.add(cell.site_id)
+            self._append_cell(cell)
+
+        n = len(self.cells)
+        if not n:
+            return self.cells
+
+        workers = workers or os.cpu_count() or 1
+        k = tiles or math.ceil(math.sqrt(workers))
+        generators = self.store.generators[:n].copy()
+        if margin is None:
+            sx, sy = (generators.max(axis=0) - generators.min(axis=0)).tolist()
+            margin = 2.0 * (math.sqrt(sx * sy / n) or max(sx, sy) / n)
+
+        parts = list(self._tiles(generators, k, margin))
+        tasks = [
+            (type(self.sh), self.sh.backend.name, type(self.vg), self.bbox, self.engine,
+             generators[ids], owned, region)
+            for ids, owned, region in parts
+        ]
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_build_tile, tasks))
+        else:
+            results = [_build_tile(task) for task in tasks]
+
+        rebuild = []
+        for (ids, owned, _), (vertices, offsets, labels, final) in zip(parts, results):
+            labels = np.where(labels >= 0, ids[np.maximum(labels, 0)], -1)
+            self.store.scatter(ids[:owned], vertices, offsets, labels)
+            rebuild.extend(ids[:owned][~final].tolist())
+
+        for site_id in rebuild:
+            cell = self._sites[site_id]
+            g = cell.generator
+            near = cell.neighbor_ids()
+            for v in cell.polygon:
+                own = GeometryUtils.dist(v, g)
+                near.update(other for other in self.index.within(v, own)
+                            if GeometryUtils.dist(v, self._sites[other].generator) < own)
+            near.discard(site_id)
+            candidates = sorted(near, key=lambda other: GeometryUtils.dist(self._sites[other].generator, g))
+            self._rebuild_cell(cell, candidates)
+
+        self.tile_stats = {
+            "tiles": len(tasks),
+            "sites": sum(len(ids) for ids, _, _ in parts),
+            "rebuilt": len(rebuild),
+        }
+        return self.cells
+
+    def stream_voronoi(self, points, every=1000, interval=None, deltas=False):
+        consumed = yielded = 0
+        pending = {}
+        last = time.monotonic()
+
+        for p in points:
+            cell, changed = self._insert(p)
+            consumed += 1
+            if deltas:
+                pending.setdefault(cell.site_id, cell)
+                for other, _ in changed:
+                    pending.setdefault(other.site_id, other)
+
+            due = every is not None and consumed % every == 0
+            if interval is not None and time.monotonic() - last >= interval:
+                due = True
+            if due:
+                yield consumed, list(pending.values()) if deltas else list(self.cells)
+                yielded = consumed
+                pending = {}
+                last = time.monotonic()
+
+        if consumed > yielded:
+            yield consumed, list(pending.values()) if deltas else list(self.cells)
+
+    def incremental_voronoi(self, points, callback=None, order=None, seed=None, on_event=None):
+        if on_event is not None:
+            self.add_listener(on_event)
+        try:
+            return self._build(points, callback, order, seed)
+        finally:
+            if on_event is not None:
+                self.remove_listener(on_event)
+
+    def _build(self, points, callback, order, seed):
+        pts = [tuple(map(float, p)) for p in points]
+        self._reset()
+
+        if self.engine == "sweep":
+            self._sweep(pts)
+            seen = set()
+            for i, p in enumerate(pts):
+                if self.listeners:
+                    cell = self.cell_at(p)
+                    created = cell.site_id not in seen
+                    seen.add(cell.site_id)
+                    for listener in list(self.listeners):
+                        listener(InsertionEvent(i, p, cell, created))
+                if callback:
+                    callback(i, p, self.cells)
+            return self.cells
+
+        if order is None or not pts:
+            for i, p in enumerate(pts):
+                self._insert(p, i)
+                if callback:
+                    callback(i, p, self.cells)
+            return self.cells
 
-        for i, p in enumerate(pts):
-            new_cell = self.insert_site(p)
+        first_seen = {}
+        for i in InsertionOrder.permutation(pts, order, seed).tolist():
+            p = pts[i]
+            cell = self._insert(p, i)[0]
+            first_seen[cell.site_id] = min(i, first_seen.get(cell.site_id, i))
             if callback:
                 callback(i, p, self.cells)
 
+        self.cells.sort(key=lambda cell: first_seen[cell.site_id])
+        self._reindex_cells()
         return self.cells
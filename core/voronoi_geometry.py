@@ -1,27 +1,47 @@
 from .geometry_utils import GeometryUtils
+from .predicates import Predicates
 from .shapely_helper import ShapelyHelper
 
 class VoronoiGeometry:
     def __init__(self, shapely_helper: ShapelyHelper):
         self.sh = shapely_helper
+        self.vertex_stats = {"emitted": 0, "welded": 0, "pruned": 0}
 
     def perpendicular_bisector(self, a, b, length=1000):
-        a = GeometryUtils.to_np(a, self.sh.Point)
-        b = GeometryUtils.to_np(b, self.sh.Point)
+        if self.sh.Point is not None and isinstance(a, self.sh.Point):
+            a = (a.x, a.y)
+        if self.sh.Point is not None and isinstance(b, self.sh.Point):
+            b = (b.x, b.y)
+        ax, ay = GeometryUtils.as_xy(a)
+        bx, by = GeometryUtils.as_xy(b)
 
-        dist = GeometryUtils.dist(a, b)
+        dist = GeometryUtils.dist((ax, ay), (bx, by))
         if dist < 1e-10:
-            return self.sh.LineString([(a[0], a[1] - length), (a[0], a[1] + length)])
+            return self.sh.LineString([(ax, ay - length), (ax, ay + length)])
 
-        m = GeometryUtils.midpoint(a, b)
-        v = GeometryUtils.vec(a, b)
-        p = GeometryUtils.perpendicular(v)
-        p = GeometryUtils.normalize(p)
+        mx, my = GeometryUtils.midpoint((ax, ay), (bx, by))
+        v = GeometryUtils.vec((ax, ay), (bx, by))
+        px, py = GeometryUtils.normalize(GeometryUtils.perpendicular(v))
 
-        p1 = m + length * GeometryUtils.np.array(p)
-        p2 = m - length * GeometryUtils.np.array(p)
+        p1 = (mx + length * px, my + length * py)
+        p2 = (mx - length * px, my - length * py)
 
-        return self.sh.LineString([tuple(p1), tuple(p2)])
+        return self.sh.LineString([p1, p2])
+
+    def bisector_coefficients(self, a, b):
+        if GeometryUtils._batched(a, b):
+            a = GeometryUtils.to_points(a)
+            b = GeometryUtils.to_points(b)
+            d = a - b
+            m = (a + b) / 2.0
+            c = -(d[..., 0]*m[..., 0] + d[..., 1]*m[..., 1])
+            return GeometryUtils.np.stack((d[..., 0], d[..., 1], c), axis=-1)
+
+        ax, ay = GeometryUtils.as_xy(a)
+        bx, by = GeometryUtils.as_xy(b)
+        dx = ax - bx
+        dy = ay - by
+        return (dx, dy, -(dx*(ax + bx) + dy*(ay + by)) / 2.0)
 
     def half_plane_polygon(self, line, space, point):
         parts = self.sh.split(space, line)
@@ -32,25 +52,27 @@ class VoronoiGeometry:
 
     def signed_distance_to_line(self, point, line):
         a, b, c = line
-        x, y = GeometryUtils.to_np(point)
+        if type(point) is tuple:
+            x, y = point
+        else:
+            x, y = GeometryUtils.to_np(point)
         return a*x + b*y + c
 
     def intersect_segment_line(self, p1, p2, line):
-        a, b, c = line
-        p1 = GeometryUtils.to_np(p1)
-        p2 = GeometryUtils.to_np(p2)
+        p1 = GeometryUtils.as_xy(p1)
+        p2 = GeometryUtils.as_xy(p2)
+        s1, v1 = Predicates.side_value(p1, line)
+        s2, v2 = Predicates.side_value(p2, line)
 
-        d = p2 - p1
-        denom = a*d[0] + b*d[1]
-        if abs(denom) < 1e-12:
+        if s1 == 0 and s2 == 0:
             return None
-
-        t = -(a*p1[0] + b*p1[1] + c) / denom
-        if not (0 <= t <= 1):
+        if s1 == 0:
+            return p1
+        if s2 == 0:
+            return p2
+        if s1 == s2:
             return None
-
-        ip = p1 + t * d
-        return tuple(ip)
+        return Predicates.crossing(p1, p2, v1, v2)
 
     def clip_polygon_by_halfplane(self, polygon, line, keep_positive=True):
         a, b, c = line
@@ -62,8 +84,9 @@ class VoronoiGeometry:
             coords = polygon
             is_shapely = False
 
-        def inside(v):
-            return (v >= 0) if keep_positive else (v <= 0)
+        def inside(p):
+            side = Predicates.side(GeometryUtils.as_xy(p), line)
+            return (side >= 0) if keep_positive else (side <= 0)
 
         output = []
         n = len(coords)
@@ -72,11 +95,8 @@ class VoronoiGeometry:
             curr = coords[i]
             prev = coords[i-1]
 
-            curr_val = self.signed_distance_to_line(curr, line)
-            prev_val = self.signed_distance_to_line(prev, line)
-
-            curr_in = inside(curr_val)
-            prev_in = inside(prev_val)
+            curr_in = inside(curr)
+            prev_in = inside(prev)
 
             if curr_in:
                 if prev_in:
@@ -94,3 +114,172 @@ class VoronoiGeometry:
             return self.sh.Polygon(output) if len(output) >= 3 else self.sh.Polygon()
 
         return output
+
+    def clip_labeled_polygon(self, polygon, labels, line, keep_positive=True, label=-1, eps=0.0):
+        n = len(polygon)
+        sign = 1 if keep_positive else -1
+        sides, vals = [], []
+        for p in polygon:
+            side, val = Predicates.side_value(p, line)
+            sides.append(sign * side)
+            vals.append(val)
+
+        output = []
+        out_labels = []
+
+        tol = eps * max((max(abs(p[0]), abs(p[1])) for p in polygon), default=0.0)
+
+        def same(p, q):
+            return abs(p[0] - q[0]) <= tol and abs(p[1] - q[1]) <= tol
+
+        stats = self.vertex_stats
+
+        def emit(p, lab):
+            stats["emitted"] += 1
+            if output and same(output[-1], p):
+                stats["welded"] += 1
+                return
+            output.append(p)
+            out_labels.append(lab)
+
+        for i in range(n):
+            curr, curr_side = polygon[i], sides[i]
+            prev, prev_side = polygon[i-1], sides[i-1]
+
+            if curr_side > 0:
+                if prev_side < 0:
+                    emit(Predicates.crossing(prev, curr, vals[i-1], vals[i]), label)
+                emit(curr, labels[i])
+            elif curr_side == 0:
+                emit(curr, label if prev_side < 0 else labels[i])
+            elif prev_side > 0:
+                emit(Predicates.crossing(prev, curr, vals[i-1], vals[i]), labels[i])
+
+        if len(output) > 1 and same(output[0], output[-1]):
+            out_labels[0] = out_labels.pop()
+            output.pop()
+            stats["welded"] += 1
+
+        m = len(output)
+        kept = [k for k in range(m) if out_labels[k] < 0 or out_labels[k] != out_labels[(k + 1) % m]]
+        if len(kept) < m:
+            stats["pruned"] += m - len(kept)
+            output = [output[k] for k in kept]
+            out_labels = [out_labels[k] for k in kept]
+        if len(output) < 3:
+            return [], []
+
+        return output, out_labels
+
+    def clip_many(self, vertices, offsets, lines, keep_positive=True, labels=None,
+                  line_labels=-1, eps=0.0):
+        return self.sh.backend.clip_many(
+            self, vertices, offsets, lines, keep_positive, labels, line_labels, eps
+        )
+
+    def clip_polygons_by_halfplanes(self, vertices, offsets, lines, keep_positive=True,
+                                    labels=None, line_labels=-1, eps=0.0):
+        np = GeometryUtils.np
+        verts = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.intp)
+        counts = np.diff(offsets)
+        n_polys = len(counts)
+        n_verts = len(verts)
+        nonempty_in = counts > 0
+
+        lines = np.asarray(lines, dtype=float)
+        if lines.ndim == 1:
+            lines = np.broadcast_to(lines, (n_polys, 3))
+        keep = np.broadcast_to(np.asarray(keep_positive, dtype=bool), (n_polys,))
+        line_labels = np.broadcast_to(np.asarray(line_labels, dtype=np.int64), (n_polys,))
+        if labels is None:
+            vert_labels = np.full(n_verts, -1, dtype=np.int64)
+        else:
+            vert_labels = np.asarray(labels, dtype=np.int64)
+
+        poly_of = np.repeat(np.arange(n_polys), counts)
+        scale = np.zeros(n_polys)
+        if n_verts:
+            scale[nonempty_in] = np.maximum.reduceat(np.abs(verts).max(axis=1), offsets[:-1][nonempty_in])
+        sides, raw = Predicates.side_values(verts, lines[poly_of])
+        vals = np.where(keep[poly_of], sides, -sides)
+
+        prev = np.arange(n_verts) - 1
+        nonempty = counts > 0
+        prev[offsets[:-1][nonempty]] = offsets[1:][nonempty] - 1
+
+        curr_val, prev_val = vals, vals[prev]
+        enter = (curr_val > 0) & (prev_val < 0)
+        leave = (curr_val < 0) & (prev_val > 0)
+        cross = enter | leave
+        keep_curr = curr_val >= 0
+
+        n_emit = cross.astype(np.intp) + keep_curr
+        pos = np.cumsum(n_emit) - n_emit
+        total = int(n_emit.sum())
+
+        out = np.empty((total, 2))
+        out_labels = np.empty(total, dtype=np.int64)
+        out_poly = np.repeat(poly_of, n_emit)
+
+        if cross.any():
+            p1 = verts[prev[cross]]
+            d = verts[cross] - p1
+            v1, v2 = raw[prev[cross]], raw[cross]
+            den = v1 - v2
+            t = np.clip(np.divide(v1, den, out=np.full(len(den), 0.5), where=den != 0), 0.0, 1.0)
+            out[pos[cross]] = p1 + t[:, None] * d
+            out_labels[pos[cross]] = np.where(
+                enter[cross], line_labels[poly_of[cross]], vert_labels[cross]
+            )
+
+        curr_pos = pos[keep_curr] + cross[keep_curr]
+        out[curr_pos] = verts[keep_curr]
+        on_line_entry = (curr_val == 0) & (prev_val < 0)
+        out_labels[curr_pos] = np.where(
+            on_line_entry[keep_curr], line_labels[poly_of[keep_curr]], vert_labels[keep_curr]
+        )
+
+        same_poly = np.zeros(total, dtype=bool)
+        same_poly[1:] = out_poly[1:] == out_poly[:-1]
+        dup = np.zeros(total, dtype=bool)
+        tol = eps * scale[out_poly]
+        dup[1:] = (np.abs(out[1:] - out[:-1]) <= tol[1:, None]).all(axis=1)
+        keep_mask = ~(dup & same_poly)
+        out, out_labels, out_poly = out[keep_mask], out_labels[keep_mask], out_poly[keep_mask]
+
+        out_counts = np.bincount(out_poly, minlength=n_polys)
+        starts = np.cumsum(out_counts) - out_counts
+        lasts = starts + out_counts - 1
+        wrap = (out_counts > 1)
+        tol = eps * scale[wrap]
+        wrap[wrap] = (np.abs(out[starts[wrap]] - out[lasts[wrap]]) <= tol[:, None]).all(axis=1)
+        out_labels[starts[wrap]] = out_labels[lasts[wrap]]
+        keep_mask = np.ones(len(out), dtype=bool)
+        keep_mask[lasts[wrap]] = False
+        out, out_labels, out_poly = out[keep_mask], out_labels[keep_mask], out_poly[keep_mask]
+        welded = total - len(out)
+
+        out_counts = np.bincount(out_poly, minlength=n_polys)
+        starts = np.cumsum(out_counts) - out_counts
+        nxt = np.arange(1, len(out) + 1)
+        nonempty = out_counts > 0
+        nxt[(starts + out_counts - 1)[nonempty]] = starts[nonempty]
+        keep_mask = (out_labels < 0) | (out_labels != out_labels[nxt % max(len(out), 1)])
+        pruned = len(out) - int(keep_mask.sum())
+
+        out_counts = np.bincount(out_poly[keep_mask], minlength=n_polys)
+        degenerate = out_counts < 3
+        keep_mask &= ~degenerate[out_poly]
+        out_counts[degenerate] = 0
+
+        self.vertex_stats["emitted"] += total
+        self.vertex_stats["welded"] += welded
+        self.vertex_stats["pruned"] += pruned
+
+        out_offsets = np.zeros(n_polys + 1, dtype=np.intp)
+        np.cumsum(out_counts, out=out_offsets[1:])
+
+        if labels is None:
+            return out[keep_mask], out_offsets
+        return out[keep_mask], out_offsets, out_labels[keep_mask]
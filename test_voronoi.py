@@ -5,11 +5,27 @@ Member 12 - Testing & Debugging
 
 import unittest
 import math
+import os
+import random
+import tempfile
 from geometry_utils import GeometryUtils
 from shapely_helper import ShapelyHelper
 from voronoi_geometry import VoronoiGeometry
 from voronoi_diagram import VoronoiDiagram
 from cell import Cell
+from site_index import SiteIndex
+from cell_store import CellStore
+from insertion_order import InsertionOrder
+from fortune import FortuneSweep
+from predicates import Predicates
+from geometry_backend import DEFAULT_BACKEND
+from spatial_join import SpatialJoin
+
+try:
+    import shapely
+    HAS_SHAPELY2 = hasattr(shapely, "contains_xy")
+except ImportError:
+    HAS_SHAPELY2 = False
 
 
 class TestGeometryUtils(unittest.TestCase):
@@ -408,6 +424,1394 @@ class TestAlgorithmProperties(unittest.TestCase):
         self.assertAlmostEqual(dist1, dist2, places=3)
 
 
+class TestNeighborWalkInsertion(unittest.TestCase):
+    """Test neighbor-walk insertion against the brute-force path"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+    
+    def build(self, points, insertion):
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, insertion=insertion)
+        return vd.incremental_voronoi(points)
+    
+    def test_walk_matches_brute_force(self):
+        """Test that walk insertion produces the same cells as brute force"""
+        rng = random.Random(7)
+        points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(60)]
+        walk = self.build(points, "walk")
+        brute = self.build(points, "brute")
+        
+        self.assertEqual(len(walk), len(brute))
+        for a, b in zip(walk, brute):
+            self.assertEqual(a.generator, b.generator)
+            diff = self.sh.Polygon(a.polygon).symmetric_difference(self.sh.Polygon(b.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+    
+    def test_walk_matches_brute_force_on_grid(self):
+        """Test walk insertion on a degenerate integer grid"""
+        points = [(x, y) for x in range(-3, 4) for y in range(-3, 4)]
+        walk = self.build(points, "walk")
+        brute = self.build(points, "brute")
+        for a, b in zip(walk, brute):
+            self.assertAlmostEqual(a.area(), b.area(), places=6)
+    
+    def test_neighbors_are_symmetric(self):
+        """Test that recorded adjacency is symmetric"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        vd.incremental_voronoi([(0, 0), (10, 0), (5, 8), (5, -8), (20, 20)])
+        for cell in vd.cells:
+            for nid in cell.neighbor_ids():
+                self.assertIn(cell.site_id, vd.cell_by_id(nid).neighbor_ids())
+    
+    def test_unknown_insertion_mode(self):
+        """Test that an unknown insertion mode is rejected"""
+        with self.assertRaises(ValueError):
+            VoronoiDiagram(self.sh, self.vg, insertion="sweep")
+
+
+class TestSiteIndex(unittest.TestCase):
+    """Test the uniform grid index over generators"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = random.Random(3)
+        self.points = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(300)]
+        self.index = SiteIndex(100)
+        for i, p in enumerate(self.points):
+            self.index.insert(i, p)
+    
+    def test_grid_grows_with_sites(self):
+        """Test that the grid is refined as sites are added"""
+        self.assertEqual(len(self.index), 300)
+        self.assertGreater(self.index.size, 1)
+    
+    def test_find_within_eps(self):
+        """Test duplicate detection within eps"""
+        self.assertEqual(self.index.find_within(self.points[42], 1e-10), 42)
+        x, y = self.points[42]
+        self.assertIsNone(self.index.find_within((x + 1e-3, y), 1e-10))
+    
+    def test_nearest_matches_linear_scan(self):
+        """Test nearest generator against a linear scan"""
+        rng = random.Random(5)
+        for _ in range(50):
+            q = (rng.uniform(-120, 120), rng.uniform(-120, 120))
+            expected = min(range(len(self.points)),
+                           key=lambda i: GeometryUtils.dist(self.points[i], q))
+            self.assertEqual(self.index.nearest(q), expected)
+    
+    def test_within_matches_linear_scan(self):
+        """Test radius queries against a linear scan"""
+        q, radius = (10.0, -20.0), 35.0
+        expected = [i for i, p in enumerate(self.points) if GeometryUtils.dist(p, q) <= radius]
+        self.assertEqual(sorted(self.index.within(q, radius)), expected)
+    
+    def test_grid_follows_clustered_sites(self):
+        """Test that the grid is laid over the sites rather than the bbox"""
+        rng = random.Random(6)
+        points = [(rng.uniform(40, 140), rng.uniform(-60, 40)) for _ in range(2000)]
+        index = SiteIndex(10000)
+        for i, p in enumerate(points):
+            index.insert(i, p)
+        self.assertLess(max(len(b) for b in index.buckets.values()), 50)
+        index.insert(len(points), (-9000.0, 9000.0))
+        self.assertTrue(index._covers((-9000.0, 9000.0)))
+        for _ in range(50):
+            q = (rng.uniform(30, 150), rng.uniform(-70, 50))
+            expected = min(range(len(points)), key=lambda i: GeometryUtils.dist(points[i], q))
+            self.assertEqual(index.nearest(q), expected)
+        self.assertEqual(index.find_within(points[7], 1e-10), 7)
+
+    def test_remove_site(self):
+        """Test that removed sites are no longer found"""
+        self.index.remove(42)
+        self.assertNotIn(42, self.index)
+        self.assertIsNone(self.index.find_within(self.points[42], 1e-10))
+    
+    def test_diagram_cell_lookup(self):
+        """Test generator and id lookups on the diagram"""
+        sh = ShapelyHelper()
+        vd = VoronoiDiagram(sh, VoronoiGeometry(sh), bbox=100)
+        cells = vd.incremental_voronoi(self.points[:20])
+        self.assertIs(vd.cell_at(self.points[7]), cells[7])
+        self.assertIs(vd.cell_by_id(cells[7].site_id), cells[7])
+        self.assertIsNone(vd.cell_at((1000, 1000)))
+
+
+class TestBatchedClipping(unittest.TestCase):
+    """Test the vectorized multi-polygon clipping kernel"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+    
+    def test_matches_scalar_clipping(self):
+        """Test that each batched result equals the scalar clip"""
+        rng = random.Random(11)
+        polygons, labels, lines, keeps = [], [], [], []
+        for _ in range(200):
+            n = rng.randint(3, 7)
+            polygons.append([(float(rng.randint(-3, 3)), rng.uniform(-3, 3)) for _ in range(n)])
+            labels.append([rng.randint(-1, 9) for _ in range(n)])
+            lines.append((rng.uniform(-1, 1), float(rng.randint(-1, 1)), rng.uniform(-1, 1)))
+            keeps.append(rng.random() < 0.5)
+        
+        offsets = [0]
+        for poly in polygons:
+            offsets.append(offsets[-1] + len(poly))
+        vertices = [p for poly in polygons for p in poly]
+        flat_labels = [l for labs in labels for l in labs]
+        
+        out, out_offsets, out_labels = self.vg.clip_polygons_by_halfplanes(
+            vertices, offsets, lines, keeps, flat_labels, 42
+        )
+        for i, poly in enumerate(polygons):
+            expected, expected_labels = self.vg.clip_labeled_polygon(
+                poly, labels[i], lines[i], keeps[i], 42
+            )
+            start, end = out_offsets[i], out_offsets[i + 1]
+            self.assertEqual([tuple(p) for p in out[start:end].tolist()], expected)
+            self.assertEqual(out_labels[start:end].tolist(), expected_labels)
+    
+    def test_single_line_broadcast(self):
+        """Test clipping several polygons by one shared line"""
+        square = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+        out, offsets = self.vg.clip_polygons_by_halfplanes(
+            square + square, [0, 4, 8], (1, 0, 0), [True, False]
+        )
+        self.assertEqual(len(offsets), 3)
+        self.assertEqual(offsets[1] - offsets[0], 4)
+        self.assertTrue((out[:4, 0] >= 0).all())
+        self.assertTrue((out[4:, 0] <= 0).all())
+    
+    def test_fully_clipped_polygon_is_empty(self):
+        """Test that a polygon on the removed side disappears"""
+        square = [(1, 1), (2, 1), (2, 2), (1, 2)]
+        out, offsets = self.vg.clip_polygons_by_halfplanes(square, [0, 4], (1, 0, 0), False)
+        self.assertEqual(len(out), 0)
+        self.assertEqual(list(offsets), [0, 0])
+
+
+class TestCellStore(unittest.TestCase):
+    """Test the array-backed cell store"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.store = CellStore(capacity=2, vertex_capacity=4)
+        self.square = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+        self.triangle = [(0.0, 0.0), (2.0, 0.0), (1.0, 2.0)]
+    
+    def test_add_grows_arrays(self):
+        """Test that adding cells grows the generator and vertex arrays"""
+        for i in range(10):
+            self.store.add((i, i), self.square)
+        self.assertEqual(len(self.store), 10)
+        self.assertEqual(self.store.generators[9].tolist(), [9.0, 9.0])
+        self.assertEqual(self.store.ring(9).tolist(), [list(p) for p in self.square])
+    
+    def test_set_ring_in_place(self):
+        """Test that a smaller ring reuses the cell's slot"""
+        i = self.store.add((0, 0), self.square)
+        used = self.store.used
+        self.store.set_ring(i, self.triangle, [1, 2, 3])
+        self.assertEqual(self.store.used, used)
+        self.assertEqual(self.store.ring_labels(i).tolist(), [1, 2, 3])
+    
+    def test_compact_preserves_rings(self):
+        """Test that compaction keeps every ring intact"""
+        for i in range(5):
+            self.store.add((i, 0), self.triangle)
+        for i in range(5):
+            self.store.set_ring(i, self.square)
+        self.store.compact()
+        self.assertEqual(self.store.used, 20)
+        for i in range(5):
+            self.assertEqual(self.store.ring(i).tolist(), [list(p) for p in self.square])
+    
+    def test_gather_scatter_round_trip(self):
+        """Test bulk gather and scatter of rings"""
+        a = self.store.add((0, 0), self.square, [1, 2, 3, 4])
+        b = self.store.add((1, 1), self.triangle, [5, 6, 7])
+        vertices, offsets, labels = self.store.gather([b, a])
+        self.assertEqual(offsets.tolist(), [0, 3, 7])
+        self.store.scatter([a, b], vertices, offsets, labels)
+        self.assertEqual(self.store.ring_labels(a).tolist(), [5, 6, 7])
+        self.assertEqual(self.store.ring_labels(b).tolist(), [1, 2, 3, 4])
+    
+    def test_cell_is_view_over_store(self):
+        """Test that a Cell reads its polygon from the shared store"""
+        cell = Cell((0.5, 0.5), polygon=self.square, store=self.store)
+        self.assertEqual(cell.polygon, self.square)
+        self.store.set_ring(cell.index, self.triangle)
+        self.assertEqual(cell.polygon, self.triangle)
+        with self.assertRaises(AttributeError):
+            cell.extra = 1
+
+
+class TestCellCache(unittest.TestCase):
+    """Test cached derived geometry on Cell"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        poly = [(0, 0), (2, 0), (2, 2), (0, 2)]
+        self.cell = Cell((1, 1), polygon=poly, shapely_helper=self.sh, voronoi_geo=self.vg)
+    
+    def test_derived_values(self):
+        """Test cached area, bounds and centroid"""
+        self.assertAlmostEqual(self.cell.area(), 4.0)
+        self.assertEqual(self.cell.bounds(), (0.0, 0.0, 2.0, 2.0))
+        cx, cy = self.cell.centroid()
+        self.assertAlmostEqual(cx, 1.0)
+        self.assertAlmostEqual(cy, 1.0)
+    
+    def test_repeated_queries_hit_cache(self):
+        """Test that repeated queries are served from the cache"""
+        self.cell.area()
+        self.cell.contains((1, 1))
+        self.cell.centroid()
+        stats = self.cell.store.cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
+    
+    def test_clip_invalidates_cache(self):
+        """Test that a clip that changes the ring refreshes derived values"""
+        self.assertAlmostEqual(self.cell.area(), 4.0)
+        self.cell.clip_with_halfplane((1, 0, -1), keep_positive=True)
+        self.assertAlmostEqual(self.cell.area(), 2.0)
+        self.assertFalse(self.cell.contains((0.5, 1)))
+        self.assertEqual(self.cell.store.cache_stats()["misses"], 2)
+    
+    def test_noop_clip_keeps_cache(self):
+        """Test that a clip removing nothing leaves the cache valid"""
+        self.cell.area()
+        self.cell.clip_with_halfplane((1, 0, 5), keep_positive=True)
+        self.cell.area()
+        self.assertEqual(self.cell.store.cache_stats()["misses"], 1)
+
+
+class TestBatchPointLocation(unittest.TestCase):
+    """Test vectorized point-in-cell queries"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        self.vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+    
+    def test_contains_many_matches_contains(self):
+        """Test that the batched mask agrees with Cell.contains"""
+        poly = [(0, 0), (4, 0), (5, 3), (2, 5), (-1, 3)]
+        cell = Cell((2, 2), polygon=poly, shapely_helper=self.sh, voronoi_geo=self.vg)
+        rng = random.Random(2)
+        points = [(rng.uniform(-2, 6), rng.uniform(-1, 6)) for _ in range(300)]
+        mask = cell.contains_many(points)
+        self.assertEqual(mask.tolist(), [cell.contains(p) for p in points])
+    
+    def test_contains_many_empty_cell(self):
+        """Test that an empty cell contains no points"""
+        cell = Cell((0, 0), shapely_helper=self.sh, voronoi_geo=self.vg)
+        self.assertFalse(cell.contains_many([(0, 0), (1, 1)]).any())
+    
+    def test_locate_many_matches_nearest_generator(self):
+        """Test that each point is assigned to its nearest generator"""
+        rng = random.Random(4)
+        sites = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(80)]
+        cells = self.vd.incremental_voronoi(sites)
+        queries = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(500)]
+        owner = self.vd.locate_many(queries)
+        for q, i in zip(queries, owner.tolist()):
+            expected = min(range(len(cells)), key=lambda k: GeometryUtils.dist(cells[k].generator, q))
+            self.assertEqual(i, expected)
+    
+    def test_locate_many_clustered_sites(self):
+        """Test that sites packed in a corner of a large bbox are still located exactly"""
+        rng = random.Random(6)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=1000)
+        cells = vd.incremental_voronoi([(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(150)])
+        queries = [(rng.uniform(-6, 6), rng.uniform(-6, 6)) for _ in range(400)]
+        queries += [(rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)) for _ in range(100)]
+        for q, i in zip(queries, vd.locate_many(queries).tolist()):
+            expected = min(range(len(cells)), key=lambda k: GeometryUtils.dist(cells[k].generator, q))
+            self.assertEqual(i, expected)
+
+    def test_locate_many_outside_bbox(self):
+        """Test that points outside the bounding box are unassigned"""
+        self.vd.incremental_voronoi([(0, 0), (10, 10)])
+        self.assertEqual(self.vd.locate_many([(500, 0), (1, 1)]).tolist(), [-1, 0])
+
+    def test_small_extent_in_default_bbox(self):
+        """Test that sites spanning a tiny square keep exact cells in the default bbox"""
+        for extent in (1e-4, 1e-5):
+            for kwargs in ({}, {"insertion": "brute"}, {"engine": "sweep"}):
+                rng = random.Random(11)
+                sites = [(rng.uniform(0, extent), rng.uniform(0, extent)) for _ in range(200)]
+                vd = VoronoiDiagram(self.sh, VoronoiGeometry(self.sh), **kwargs)
+                cells = vd.incremental_voronoi(sites)
+                self.assertTrue(all(cell.polygon for cell in cells))
+                queries = [(rng.uniform(0, extent), rng.uniform(0, extent)) for _ in range(300)]
+                for q, i in zip(queries, vd.locate_many(queries).tolist()):
+                    best = min(GeometryUtils.dist(c.generator, q) for c in cells)
+                    self.assertLessEqual(GeometryUtils.dist(cells[i].generator, q), best + extent * 1e-9)
+
+
+class TestScalarFastPath(unittest.TestCase):
+    """Test the allocation-free path for plain 2-tuples"""
+    
+    def test_tuple_inputs_return_floats(self):
+        """Test that tuple inputs stay in plain Python floats"""
+        self.assertIsInstance(GeometryUtils.dist((0.0, 0.0), (3.0, 4.0)), float)
+        self.assertEqual(GeometryUtils.midpoint((0.0, 0.0), (4.0, 2.0)), (2.0, 1.0))
+        self.assertEqual(GeometryUtils.vec((1.0, 1.0), (4.0, 5.0)), (3.0, 4.0))
+    
+    def test_array_inputs_keep_numpy_path(self):
+        """Test that array inputs still return NumPy arrays"""
+        a = GeometryUtils.to_np((0, 0))
+        b = GeometryUtils.to_np((4, 2))
+        self.assertEqual(GeometryUtils.midpoint(a, b).tolist(), [2.0, 1.0])
+        self.assertEqual(GeometryUtils.vec(a, b).tolist(), [4.0, 2.0])
+    
+    def test_as_xy(self):
+        """Test coercion of point-like values to a float pair"""
+        self.assertEqual(GeometryUtils.as_xy((1, 2)), (1.0, 2.0))
+        self.assertEqual(GeometryUtils.as_xy([3, 4]), (3.0, 4.0))
+    
+    def test_intersection_matches_numpy_inputs(self):
+        """Test segment/line intersection for tuple and array inputs"""
+        vg = VoronoiGeometry(ShapelyHelper())
+        line = (1.0, 0.0, -0.5)
+        expected = vg.intersect_segment_line((0.0, 0.0), (1.0, 1.0), line)
+        self.assertEqual(expected, (0.5, 0.5))
+        result = vg.intersect_segment_line(GeometryUtils.to_np((0, 0)), [1, 1], line)
+        self.assertEqual(result, expected)
+
+
+class TestBatchedGeometryUtils(unittest.TestCase):
+    """Test GeometryUtils over (N, 2) arrays"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.a = GeometryUtils.to_points([(0, 0), (1, 1), (2, 5)])
+        self.b = GeometryUtils.to_points([(3, 4), (1, 2), (-2, 5)])
+    
+    def test_pairwise_operations(self):
+        """Test dist, midpoint and vec on arrays of pairs"""
+        self.assertEqual(GeometryUtils.dist(self.a, self.b).tolist(), [5.0, 1.0, 4.0])
+        self.assertEqual(GeometryUtils.midpoint(self.a, self.b).tolist(),
+                         [[1.5, 2.0], [1.0, 1.5], [0.0, 5.0]])
+        self.assertEqual(GeometryUtils.vec(self.a, self.b).tolist(),
+                         [[3.0, 4.0], [0.0, 1.0], [-4.0, 0.0]])
+    
+    def test_broadcast_against_single_point(self):
+        """Test broadcasting an array of points against one point"""
+        self.assertEqual(GeometryUtils.dist(self.b, (0, 0)).tolist(), [5.0, 5.0 ** 0.5, 29.0 ** 0.5])
+    
+    def test_vector_operations(self):
+        """Test dot, cross, perpendicular and normalize on arrays"""
+        v = GeometryUtils.vec(self.a, self.b)
+        self.assertEqual(GeometryUtils.dot(v, v).tolist(), [25.0, 1.0, 16.0])
+        self.assertEqual(GeometryUtils.cross(v, GeometryUtils.perpendicular(v)).tolist(),
+                         [25.0, 1.0, 16.0])
+        lengths = GeometryUtils.dist(GeometryUtils.normalize(v), (0, 0))
+        for length in lengths.tolist():
+            self.assertAlmostEqual(length, 1.0)
+    
+    def test_normalize_rejects_zero_vector(self):
+        """Test that a zero vector in a batch raises"""
+        with self.assertRaises(ValueError):
+            GeometryUtils.normalize([(1, 0), (0, 0)])
+    
+    def test_to_points_rejects_bad_shape(self):
+        """Test that arrays without a trailing dimension of 2 are rejected"""
+        with self.assertRaises(ValueError):
+            GeometryUtils.to_points([(1, 2, 3)])
+
+
+class TestBisectorCoefficients(unittest.TestCase):
+    """Test analytic bisector half-plane coefficients"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+    
+    def test_positive_on_first_site(self):
+        """Test that the first site lies on the positive side"""
+        line = self.vg.bisector_coefficients((0, 0), (4, 2))
+        self.assertGreater(self.vg.signed_distance_to_line((0.0, 0.0), line), 0)
+        self.assertLess(self.vg.signed_distance_to_line((4.0, 2.0), line), 0)
+        self.assertAlmostEqual(self.vg.signed_distance_to_line((2.0, 1.0), line), 0.0)
+    
+    def test_matches_linestring_bisector(self):
+        """Test that the coefficients describe the same line as the LineString form"""
+        a, b = (1.0, -2.0), (-3.0, 5.0)
+        line = self.vg.bisector_coefficients(a, b)
+        for p in self.vg.perpendicular_bisector(a, b).coords:
+            self.assertAlmostEqual(self.vg.signed_distance_to_line(tuple(p), line), 0.0, places=6)
+    
+    def test_batched_coefficients(self):
+        """Test bulk coefficients against the scalar form"""
+        rng = random.Random(8)
+        a = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(20)]
+        b = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(20)]
+        lines = self.vg.bisector_coefficients(GeometryUtils.to_points(a), GeometryUtils.to_points(b))
+        self.assertEqual(lines.shape, (20, 3))
+        for row, p, q in zip(lines.tolist(), a, b):
+            for x, y in zip(row, self.vg.bisector_coefficients(p, q)):
+                self.assertAlmostEqual(x, y)
+
+
+class TestInsertionOrder(unittest.TestCase):
+    """Test locality-preserving insertion orders"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(9)
+        self.points = sorted((rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(80))
+    
+    def test_orders_are_permutations(self):
+        """Test that every order visits each point once"""
+        for order in InsertionOrder.ORDERS:
+            perm = InsertionOrder.permutation(self.points, order, seed=1)
+            self.assertEqual(sorted(perm.tolist()), list(range(len(self.points))))
+    
+    def test_cells_keep_input_order(self):
+        """Test that cells[i] still belongs to input point i"""
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points)
+        for order in InsertionOrder.ORDERS:
+            vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+            cells = vd.incremental_voronoi(self.points, order=order, seed=1)
+            self.assertEqual([c.generator for c in cells], [tuple(p) for p in self.points])
+            for a, b in zip(cells, reference):
+                self.assertAlmostEqual(a.area(), b.area(), places=6)
+    
+    def test_duplicates_with_order(self):
+        """Test that duplicates are still collapsed in input order"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        cells = vd.incremental_voronoi([(5, 5), (0, 0), (5, 5), (1, 2)], order="brio", seed=3)
+        self.assertEqual([c.generator for c in cells], [(5.0, 5.0), (0.0, 0.0), (1.0, 2.0)])
+    
+    def test_unknown_order(self):
+        """Test that an unknown order is rejected"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        with self.assertRaises(ValueError):
+            vd.incremental_voronoi(self.points, order="random")
+
+
+class TestRemoveSite(unittest.TestCase):
+    """Test site deletion with local repair"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(12)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(50)]
+        self.vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.vd.incremental_voronoi(self.points)
+    
+    def assertMatchesRebuild(self, remaining):
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(remaining)
+        expected = {c.generator: c for c in reference}
+        self.assertEqual(len(self.vd.cells), len(expected))
+        for cell in self.vd.cells:
+            diff = self.sh.Polygon(cell.polygon).symmetric_difference(
+                self.sh.Polygon(expected[cell.generator].polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+    
+    def test_remove_by_point(self):
+        """Test removing a site by its coordinates"""
+        removed = self.vd.remove_site(self.points[10])
+        self.assertEqual(removed.polygon, [])
+        self.assertIsNone(self.vd.cell_at(self.points[10]))
+        self.assertMatchesRebuild(self.points[:10] + self.points[11:])
+    
+    def test_remove_by_id(self):
+        """Test removing a site by its id"""
+        site_id = self.vd.cells[3].site_id
+        self.vd.remove_site(site_id)
+        self.assertIsNone(self.vd.cell_by_id(site_id))
+        self.assertMatchesRebuild(self.points[:3] + self.points[4:])
+
+    def test_remove_moves_last_cell_into_the_gap(self):
+        """Test that removal swaps the last cell into the freed position"""
+        cells = list(self.vd.cells)
+        self.vd.remove_site(cells[3])
+        self.assertIs(self.vd.cells[3], cells[-1])
+        self.assertEqual(self.vd.cells, cells[:3] + [cells[-1]] + cells[4:-1])
+        self.vd.remove_site(cells[-1])
+        self.vd.remove_site(cells[-2])
+        self.assertEqual(self.vd.cells, cells[:3] + [cells[-3]] + cells[4:-3])
+        self.assertMatchesRebuild(self.points[:3] + self.points[4:-2])
+        queries = [c.generator for c in self.vd.cells]
+        self.assertEqual(self.vd.locate_many(queries).tolist(), list(range(len(queries))))
+
+    def test_remove_many_keeps_adjacency_symmetric(self):
+        """Test repeated removals on a degenerate grid"""
+        points = [(float(x), float(y)) for x in range(-4, 5) for y in range(-4, 5)]
+        self.vd.incremental_voronoi(points)
+        rng = random.Random(1)
+        rng.shuffle(points)
+        for p in points[:40]:
+            self.vd.remove_site(p)
+        for cell in self.vd.cells:
+            for nid in cell.neighbor_ids():
+                self.assertIn(cell.site_id, self.vd.cell_by_id(nid).neighbor_ids())
+        self.assertMatchesRebuild(points[40:])
+
+    def test_remove_with_many_outside_sites(self):
+        """Test that removal only rebuilds nearby sites when many sites lie outside the bbox"""
+        rng = random.Random(5)
+        outside = [(rng.choice([-1, 1]) * rng.uniform(101, 400), rng.uniform(-400, 400))
+                   for _ in range(200)]
+        self.vd.insert_sites(outside, seed=3)
+        rebuilt = []
+        rebuild = self.vd._rebuild_cell
+        self.vd._rebuild_cell = lambda cell, *args: rebuilt.append(cell) or rebuild(cell, *args)
+        for p in self.points[:5]:
+            self.vd.remove_site(p)
+        self.assertLess(len(rebuilt), 5 * 12)
+        self.assertMatchesRebuild(self.points[5:] + outside)
+
+    def test_remove_missing_site(self):
+        """Test that removing an unknown site raises"""
+        with self.assertRaises(KeyError):
+            self.vd.remove_site((1000.0, 1000.0))
+
+
+class TestMoveSite(unittest.TestCase):
+    """Test kinetic site moves"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(13)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(60)]
+        self.vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.vd.incremental_voronoi(self.points)
+    
+    def assertMatchesRebuild(self):
+        generators = [cell.generator for cell in self.vd.cells]
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(generators)
+        for cell, expected in zip(self.vd.cells, reference):
+            diff = self.sh.Polygon(cell.polygon).symmetric_difference(self.sh.Polygon(expected.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+    
+    def test_small_move_uses_fast_path(self):
+        """Test that a tiny move keeps the topology and the site id"""
+        cell = self.vd.cells[5]
+        site_id = cell.site_id
+        x, y = cell.generator
+        moved = self.vd.move_site(cell, (x + 1e-3, y - 1e-3))
+        self.assertIs(moved, cell)
+        self.assertEqual(moved.site_id, site_id)
+        self.assertEqual(moved.generator, (x + 1e-3, y - 1e-3))
+        self.assertEqual(self.vd.move_stats["fast"], 1)
+        self.assertMatchesRebuild()
+    
+    def test_large_move_repairs_topology(self):
+        """Test that a move across the diagram falls back to remove and insert"""
+        cell = self.vd.cells[0]
+        x, y = cell.generator
+        self.vd.move_site(cell.site_id, (-x, -y))
+        self.assertEqual(self.vd.move_stats["slow"], 1)
+        self.assertIs(self.vd.cell_at((-x, -y)), cell)
+        self.assertMatchesRebuild()
+    
+    def test_many_random_moves(self):
+        """Test a sequence of random moves against a full rebuild"""
+        rng = random.Random(21)
+        for _ in range(80):
+            cell = rng.choice(self.vd.cells)
+            step = rng.choice([0.1, 2.0, 30.0])
+            x, y = cell.generator
+            target = (x + rng.uniform(-step, step), y + rng.uniform(-step, step))
+            if self.vd.cell_at(target) is None:
+                self.vd.move_site(cell, target)
+        self.assertMatchesRebuild()
+    
+    def test_move_onto_existing_site(self):
+        """Test that moving onto another site is rejected"""
+        with self.assertRaises(ValueError):
+            self.vd.move_site(self.points[0], self.points[1])
+
+
+class TestBulkInsertSites(unittest.TestCase):
+    """Test bulk insertion with conflict lists"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(14)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(120)]
+    
+    def assertSameCells(self, cells, reference):
+        self.assertEqual([c.generator for c in cells], [c.generator for c in reference])
+        for a, b in zip(cells, reference):
+            diff = self.sh.Polygon(a.polygon).symmetric_difference(self.sh.Polygon(b.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+    
+    def test_matches_sequential_insertion(self):
+        """Test that bulk insertion equals inserting one site at a time"""
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        result = vd.insert_sites(self.points, seed=1)
+        self.assertEqual([c.generator for c in result], [tuple(p) for p in self.points])
+        self.assertSameCells(vd.cells, reference)
+    
+    def test_into_existing_diagram(self):
+        """Test bulk insertion on top of existing sites, with duplicates and outside points"""
+        points = self.points + [self.points[0], (250.0, -130.0)]
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(points)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        vd.incremental_voronoi(points[:20])
+        result = vd.insert_sites(points[20:], seed=2)
+        self.assertIs(result[-2], vd.cells[0])
+        self.assertSameCells(vd.cells, reference)
+    
+    def test_empty_input(self):
+        """Test that no points inserts nothing"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.assertEqual(vd.insert_sites([]), [])
+        self.assertEqual(vd.cells, [])
+
+
+class TestSweepEngine(unittest.TestCase):
+    """Test the Fortune sweep-line construction engine"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(15)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(150)]
+    
+    def assertSameCells(self, cells, reference):
+        self.assertEqual([c.generator for c in cells], [c.generator for c in reference])
+        for a, b in zip(cells, reference):
+            if not b.polygon:
+                self.assertEqual(a.polygon, [])
+                continue
+            diff = self.sh.Polygon(a.polygon).symmetric_difference(self.sh.Polygon(b.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+    
+    def test_square_neighbor_pairs(self):
+        """Test the Delaunay pairs of a square with a centre point"""
+        points = [(0, 0), (2, 0), (2, 2), (0, 2), (1, 1)]
+        pairs = FortuneSweep(points).neighbor_pairs()
+        self.assertEqual(pairs, {(0, 1), (1, 2), (2, 3), (0, 3), (0, 4), (1, 4), (2, 4), (3, 4)})
+    
+    def test_matches_incremental_engine(self):
+        """Test that the sweep engine builds the same cells as the incremental one"""
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points)
+        cells = VoronoiDiagram(self.sh, self.vg, bbox=100, engine="sweep").incremental_voronoi(self.points)
+        self.assertSameCells(cells, reference)
+    
+    def test_degenerate_input(self):
+        """Test grid points, duplicates and sites outside the box"""
+        rng = random.Random(16)
+        points = [(rng.randint(-5, 5), rng.randint(-5, 5)) for _ in range(60)] + [(40.0, 3.0)]
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=10).incremental_voronoi(points)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=10, engine="sweep")
+        cells = vd.incremental_voronoi(points)
+        self.assertSameCells(cells, reference)
+        for cell in cells:
+            for site_id in cell.neighbor_ids():
+                self.assertIn(cell.site_id, vd.cell_by_id(site_id).neighbor_ids())
+    
+    def test_diagram_stays_editable(self):
+        """Test that a sweep-built diagram accepts further edits"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, engine="sweep")
+        vd.incremental_voronoi(self.points[:-1])
+        vd.insert_site(self.points[-1])
+        vd.remove_site(self.points[0])
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points[1:])
+        self.assertSameCells(sorted(vd.cells, key=lambda c: c.generator), sorted(reference, key=lambda c: c.generator))
+    
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected"""
+        with self.assertRaises(ValueError):
+            VoronoiDiagram(self.sh, self.vg, engine="delaunay")
+
+
+class TestParallelConstruction(unittest.TestCase):
+    """Test tiled construction with seam verification"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(17)
+        self.points = [(rng.uniform(-110, 110), rng.uniform(-100, 100)) for _ in range(300)]
+        self.reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points)
+    
+    def assertSameCells(self, cells, reference):
+        self.assertEqual([c.generator for c in cells], [c.generator for c in reference])
+        for a, b in zip(cells, reference):
+            if not b.polygon:
+                self.assertEqual(a.polygon, [])
+                continue
+            diff = self.sh.Polygon(a.polygon).symmetric_difference(self.sh.Polygon(b.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+    
+    def test_tiles_match_serial_build(self):
+        """Test that tiled construction equals a serial build"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, engine="sweep")
+        cells = vd.parallel_voronoi(self.points + self.points[:5], workers=1, tiles=3)
+        self.assertEqual(vd.tile_stats["tiles"], 9)
+        self.assertSameCells(cells, self.reference)
+    
+    def test_thin_margins_are_repaired(self):
+        """Test that seam cells missing sites are rebuilt in the parent"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        cells = vd.parallel_voronoi(self.points, workers=1, tiles=4, margin=1.0)
+        self.assertGreater(vd.tile_stats["rebuilt"], 0)
+        self.assertSameCells(cells, self.reference)
+        for cell in cells:
+            for site_id in cell.neighbor_ids():
+                self.assertIn(cell.site_id, vd.cell_by_id(site_id).neighbor_ids())
+    
+    def test_process_pool(self):
+        """Test construction in worker processes"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, engine="sweep")
+        cells = vd.parallel_voronoi(self.points, workers=2, tiles=2)
+        self.assertSameCells(cells, self.reference)
+
+    def test_tiles_follow_clustered_sites(self):
+        """Test that tiles and margins follow the sites rather than the bbox"""
+        points = [(x / 20.0, y / 20.0) for x, y in self.points]
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=1000).incremental_voronoi(points)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=1000, engine="sweep")
+        cells = vd.parallel_voronoi(points, workers=1, tiles=2)
+        self.assertLess(vd.tile_stats["sites"], 2 * len(points))
+        self.assertSameCells(cells, reference)
+
+
+class TestStreamingConstruction(unittest.TestCase):
+    """Test building a diagram from a stream of sites"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(18)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(250)]
+    
+    def test_snapshots_every_k_sites(self):
+        """Test that snapshots arrive every K sites and once at the end"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        snapshots = list(vd.stream_voronoi(iter(self.points), every=100))
+        self.assertEqual([count for count, _ in snapshots], [100, 200, 250])
+        self.assertEqual([len(cells) for _, cells in snapshots], [100, 200, 250])
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points)
+        self.assertEqual([c.polygon for c in vd.cells], [c.polygon for c in reference])
+    
+    def test_interval_snapshots(self):
+        """Test that a zero interval yields after every site"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        counts = [count for count, _ in vd.stream_voronoi(iter(self.points[:10]), every=None, interval=0)]
+        self.assertEqual(counts, list(range(1, 11)))
+    
+    def test_deltas_cover_changed_cells(self):
+        """Test that deltas list exactly the cells that changed"""
+        for insertion in ("walk", "brute"):
+            vd = VoronoiDiagram(self.sh, self.vg, bbox=100, insertion=insertion)
+            before = {}
+            for _, delta in vd.stream_voronoi((p for p in self.points), every=7, deltas=True):
+                changed = {cell.site_id for cell in delta}
+                for cell in vd.cells:
+                    if cell.site_id not in changed:
+                        self.assertEqual(cell.polygon, before[cell.site_id])
+                before = {cell.site_id: cell.polygon for cell in vd.cells}
+            self.assertEqual(len(vd.cells), len(self.points))
+    
+    def test_empty_stream(self):
+        """Test that an empty stream yields nothing"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.assertEqual(list(vd.stream_voronoi(iter([]))), [])
+
+
+class TestInsertionEvents(unittest.TestCase):
+    """Test structured per-insertion events"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(19)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(120)]
+    
+    def replay(self, vd, build):
+        """Apply events to a ring cache and check it against the diagram"""
+        rings = {}
+        events = []
+        
+        def on_event(event):
+            events.append(event)
+            if not event.created:
+                return
+            rings[event.cell.site_id] = event.cell.polygon
+            for cell, old, new in event.clipped:
+                self.assertEqual(rings[cell.site_id], old)
+                rings[cell.site_id] = new
+            current = {v for ring in rings.values() for v in ring}
+            for v in event.removed_vertices:
+                self.assertNotIn(v, current)
+        
+        vd.add_listener(on_event)
+        build(vd)
+        self.assertEqual(rings, {cell.site_id: cell.polygon for cell in vd.cells})
+        return events
+    
+    def test_replay_matches_diagram(self):
+        """Test that events are enough to mirror the diagram"""
+        for insertion in ("walk", "brute"):
+            vd = VoronoiDiagram(self.sh, self.vg, bbox=100, insertion=insertion)
+            events = self.replay(vd, lambda vd: vd.incremental_voronoi(self.points))
+            self.assertEqual([e.index for e in events], list(range(len(self.points))))
+            self.assertTrue(any(e.removed_vertices for e in events))
+    
+    def test_bulk_and_single_insertions(self):
+        """Test events from insert_site and insert_sites"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        events = self.replay(vd, lambda vd: (vd.insert_sites(self.points[:60], seed=3),
+                                             vd.insert_site(self.points[60]),
+                                             vd.insert_site(self.points[0])))
+        self.assertEqual(sorted(e.index for e in events[:60]), list(range(60)))
+        self.assertIsNone(events[60].index)
+        self.assertFalse(events[-1].created)
+        self.assertIs(events[-1].cell, vd.cells[0])
+    
+    def test_on_event_is_scoped_to_the_call(self):
+        """Test that on_event only listens during incremental_voronoi"""
+        events = []
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        vd.incremental_voronoi(self.points[:10] + self.points[:1], on_event=events.append)
+        self.assertEqual(len(events), 11)
+        self.assertFalse(events[-1].created)
+        self.assertEqual(vd.listeners, [])
+    
+    def test_sweep_engine_events(self):
+        """Test that the sweep engine reports one created event per site"""
+        events = []
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, engine="sweep")
+        cells = vd.incremental_voronoi(self.points + self.points[:2], on_event=events.append)
+        self.assertEqual([e.cell for e in events if e.created], cells)
+        self.assertEqual(sum(not e.created for e in events), 2)
+
+
+class TestHalfEdgeMesh(unittest.TestCase):
+    """Test the optional shared-vertex half-edge topology"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(20)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(200)]
+    
+    def assertMeshMatches(self, vd):
+        """Check rings, twins and shared endpoints against the cells"""
+        mesh = vd.mesh
+        self.assertEqual(set(mesh.cell_ids()), {c.site_id for c in vd.cells if c.polygon})
+        self.assertEqual(mesh.corner_count(), sum(len(c.polygon) for c in vd.cells))
+        for cell in vd.cells:
+            for a, b in zip(mesh.ring(cell.site_id).tolist(), cell.polygon):
+                self.assertAlmostEqual(a[0], b[0], places=9)
+                self.assertAlmostEqual(a[1], b[1], places=9)
+            self.assertEqual(sorted(mesh.neighbors(cell.site_id)), sorted(cell.neighbor_ids()))
+            edges = mesh.half_edges(cell.site_id)
+            for k, edge in enumerate(edges):
+                self.assertEqual(mesh.next[edge], edges[(k + 1) % len(edges)])
+                self.assertEqual(mesh.cell[edge], cell.site_id)
+                if mesh.site[edge] < 0:
+                    continue
+                twin = mesh.twin[edge]
+                self.assertEqual(mesh.twin[twin], edge)
+                self.assertEqual(mesh.cell[twin], mesh.site[edge])
+                self.assertEqual((mesh.origin(twin), mesh.target[twin]), (mesh.target[edge], mesh.origin(edge)))
+    
+    def test_disabled_by_default(self):
+        """Test that no mesh is kept unless requested"""
+        self.assertIsNone(VoronoiDiagram(self.sh, self.vg).mesh)
+    
+    def test_vertices_are_shared(self):
+        """Test that interior vertices are stored once for their three cells"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, half_edges=True)
+        vd.incremental_voronoi(self.points)
+        self.assertMeshMatches(vd)
+        self.assertLess(vd.mesh.vertex_count() * 2.5, vd.mesh.corner_count())
+
+    def test_cells_read_from_the_mesh(self):
+        """Test that the mesh replaces per-cell rings and shares exact coordinates"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, half_edges=True)
+        vd.incremental_voronoi(self.points)
+        reference = VoronoiDiagram(self.sh, self.vg, bbox=100).incremental_voronoi(self.points)
+        self.assertEqual(len(vd.store.vertices), 0)
+        corners = {}
+        for cell, expected in zip(vd.cells, reference):
+            self.assertEqual(cell.edge_sites, expected.edge_sites)
+            diff = self.sh.Polygon(cell.polygon).symmetric_difference(self.sh.Polygon(expected.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+            for edge, point in zip(vd.mesh.half_edges(cell.site_id), cell.polygon):
+                self.assertEqual(corners.setdefault(vd.mesh.target[edge], point), point)
+
+    def test_engines_build_the_same_mesh(self):
+        """Test the mesh after sweep and bulk construction"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, engine="sweep", half_edges=True)
+        vd.incremental_voronoi(self.points)
+        self.assertMeshMatches(vd)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, half_edges=True)
+        vd.insert_sites(self.points, seed=4)
+        self.assertMeshMatches(vd)
+    
+    def test_mesh_follows_edits(self):
+        """Test that inserts, removals and moves keep the mesh in sync"""
+        rng = random.Random(21)
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100, half_edges=True)
+        vd.incremental_voronoi(self.points + [(150.0, 20.0)])
+        for _ in range(60):
+            cell = rng.choice(vd.cells)
+            roll = rng.random()
+            if roll < 0.3:
+                vd.remove_site(cell)
+            elif roll < 0.6:
+                vd.insert_site((rng.uniform(-90, 90), rng.uniform(-90, 90)))
+            else:
+                x, y = cell.generator
+                vd.move_site(cell, (x + rng.uniform(-3, 3), y + rng.uniform(-3, 3)))
+        self.assertMeshMatches(vd)
+        vd.store.compact()
+        self.assertEqual(vd.mesh.used, vd.mesh.corner_count())
+        self.assertMeshMatches(vd)
+
+
+class TestAdjacency(unittest.TestCase):
+    """Test cell neighbors and the CSR adjacency export"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(22)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(150)]
+        self.vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.vd.incremental_voronoi(self.points)
+    
+    def test_neighbors_share_an_edge(self):
+        """Test that neighbors are exactly the cells sharing a boundary segment"""
+        cell = self.vd.cells[0]
+        boundary = self.sh.Polygon(cell.polygon).boundary.buffer(1e-7)
+        expected = [c for c in self.vd.cells if c is not cell
+                    and boundary.intersection(self.sh.Polygon(c.polygon).boundary).length > 1e-6]
+        self.assertEqual(sorted(cell.neighbors(), key=lambda c: c.site_id),
+                         sorted(expected, key=lambda c: c.site_id))
+    
+    def test_removed_cells_are_not_neighbors(self):
+        """Test that removed sites drop out of neighbor lists"""
+        cell = self.vd.cells[0]
+        gone = cell.neighbors()[0]
+        self.vd.remove_site(gone)
+        self.assertNotIn(gone, cell.neighbors())
+        self.assertEqual(gone.neighbors(), [])
+    
+    def test_csr_matches_neighbors(self):
+        """Test that the CSR rows list each cell's neighbor positions"""
+        self.vd.remove_site(self.vd.cells[10])
+        indptr, indices = self.vd.adjacency()
+        self.assertEqual(len(indptr), len(self.vd.cells) + 1)
+        position = {cell.site_id: i for i, cell in enumerate(self.vd.cells)}
+        for i, cell in enumerate(self.vd.cells):
+            row = indices[indptr[i]:indptr[i + 1]].tolist()
+            self.assertEqual(row, sorted(position[c.site_id] for c in cell.neighbors()))
+            for j in row:
+                self.assertIn(i, indices[indptr[j]:indptr[j + 1]].tolist())
+    
+    def test_empty_diagram(self):
+        """Test the export of an empty diagram"""
+        indptr, indices = VoronoiDiagram(self.sh, self.vg).adjacency()
+        self.assertEqual(indptr.tolist(), [0])
+        self.assertEqual(len(indices), 0)
+
+
+class TestWalkingLocate(unittest.TestCase):
+    """Test point location by walking the adjacency"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(23)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(300)]
+        self.queries = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(200)]
+        self.vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.vd.incremental_voronoi(self.points)
+    
+    def nearest(self, q):
+        """Brute-force nearest cell"""
+        return min(self.vd.cells, key=lambda c: GeometryUtils.dist(c.generator, q))
+    
+    def test_matches_nearest_generator(self):
+        """Test that locate returns the cell of the nearest generator"""
+        for q in self.queries:
+            self.assertIs(self.vd.locate(q), self.nearest(q))
+    
+    def test_hints(self):
+        """Test locating from explicit hints, near or far"""
+        far = self.vd.cells[0]
+        for q in self.queries[:50]:
+            self.assertIs(self.vd.locate(q, hint=far), self.nearest(q))
+            self.assertIs(self.vd.locate(q, hint=far.site_id), self.nearest(q))
+    
+    def test_coherent_queries_walk(self):
+        """Test that nearby queries walk from the last cell instead of the grid"""
+        self.vd.locate((-25.0, -15.0))
+        self.vd.locate_stats = {"walks": 0, "steps": 0, "fallbacks": 0}
+        for k in range(100):
+            q = (k * 0.5 - 25.0, k * 0.3 - 15.0)
+            self.assertIs(self.vd.locate(q), self.nearest(q))
+        self.assertEqual(self.vd.locate_stats["fallbacks"], 0)
+        self.assertGreater(self.vd.locate_stats["steps"], 0)
+    
+    def test_fallback_follows_local_spacing(self):
+        """Test that the walk threshold scales with the start cell, not the grid"""
+        rng = random.Random(24)
+        dense = [(rng.uniform(-2, 2), rng.uniform(-2, 2)) for _ in range(400)]
+        sparse = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(12)]
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        cells = vd.incremental_voronoi(dense + sparse)
+        nearest = lambda q: min(cells, key=lambda c: GeometryUtils.dist(c.generator, q))
+        for cell in cells[400:]:
+            far = max(cell.polygon, key=lambda v: GeometryUtils.dist(v, cell.generator))
+            q = tuple(0.9 * a + 0.1 * g for a, g in zip(far, cell.generator))
+            self.assertIs(vd.locate(q, hint=cell), cell)
+        self.assertEqual(vd.locate_stats["fallbacks"], 0)
+        self.assertIs(vd.locate((-1.0, -1.0), hint=nearest((1.0, 1.0))), nearest((-1.0, -1.0)))
+        self.assertEqual(vd.locate_stats["fallbacks"], 1)
+
+    def test_outside_and_stale_hints(self):
+        """Test queries outside the box and hints to removed cells"""
+        self.assertIsNone(self.vd.locate((150.0, 0.0)))
+        gone = self.vd.cells[5]
+        self.vd.remove_site(gone)
+        q = gone.generator
+        self.assertIs(self.vd.locate(q, hint=gone), self.nearest(q))
+        self.assertIsNone(VoronoiDiagram(self.sh, self.vg).locate((0.0, 0.0)))
+
+
+class TestSpatialJoin(unittest.TestCase):
+    """Test chunked bulk assignment of points to cells"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = GeometryUtils.np.random.default_rng(24)
+        self.vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        self.vd.incremental_voronoi(rng.uniform(-90, 90, (300, 2)).tolist() + [(150.0, 3.0)])
+        self.queries = rng.uniform(-110, 110, (20000, 2))
+    
+    def test_matches_locate_many(self):
+        """Test that the join agrees with per-cell containment"""
+        owner = self.vd.spatial_join(self.queries, workers=1)
+        self.assertEqual(owner.dtype, GeometryUtils.np.int32)
+        self.assertEqual(owner.tolist(), self.vd.locate_many(self.queries).tolist())
+    
+    def test_thread_chunks(self):
+        """Test that chunking across threads does not change the result"""
+        expected = self.vd.spatial_join(self.queries, workers=1)
+        owner = self.vd.spatial_join(self.queries, chunk_size=3000, workers=3)
+        self.assertEqual(owner.tolist(), expected.tolist())
+    
+    def test_memory_mapped_file_in_processes(self):
+        """Test joining a .npy file through worker processes"""
+        expected = self.vd.spatial_join(self.queries, workers=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "points.npy")
+            GeometryUtils.np.save(path, self.queries)
+            owner = self.vd.spatial_join(path, chunk_size=5000, workers=2, executor="process")
+        self.assertEqual(owner.tolist(), expected.tolist())
+
+    def test_clustered_sites(self):
+        """Test sites clustered in a small part of a large box"""
+        rng = GeometryUtils.np.random.default_rng(25)
+        vd = VoronoiDiagram(self.sh, self.vg)
+        vd.incremental_voronoi(rng.uniform(-50, 50, (400, 2)).tolist())
+        join = SpatialJoin.from_diagram(vd)
+        self.assertLess(join.table.shape[1], 40)
+        queries = GeometryUtils.np.concatenate([rng.uniform(-60, 60, (5000, 2)),
+                                                rng.uniform(-10000, 10000, (1000, 2))])
+        owner = vd.spatial_join(queries, chunk_size=1000, workers=1)
+        self.assertEqual(owner.tolist(), vd.locate_many(queries).tolist())
+
+    def test_empty_diagram_and_bad_executor(self):
+        """Test an empty diagram and an unknown executor"""
+        owner = VoronoiDiagram(self.sh, self.vg).spatial_join([(0.0, 0.0), (1.0, 1.0)])
+        self.assertEqual(owner.tolist(), [-1, -1])
+        with self.assertRaises(ValueError):
+            self.vd.spatial_join(self.queries, executor="fiber")
+
+
+class TestClipCulling(unittest.TestCase):
+    """Test bounding-radius culling of no-op clips"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        rng = random.Random(25)
+        self.points = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(200)]
+    
+    def test_radius_tracks_ring(self):
+        """Test that each cell's radius is its farthest vertex from the generator"""
+        vd = VoronoiDiagram(self.sh, self.vg, bbox=100)
+        vd.incremental_voronoi(self.points)
+        vd.move_site(vd.cells[3], (vd.cells[3].generator[0] + 1.0, vd.cells[3].generator[1]))
+        for cell in vd.cells:
+            expected = max(GeometryUtils.dist(v, cell.generator) for v in cell.polygon)
+            self.assertAlmostEqual(cell.radius, expected, places=9)
+    
+    def test_far_clip_is_culled(self):
+        """Test that a half-plane beyond the radius skips the clip"""
+        cell = Cell((0, 0), polygon=[(-1, -1), (1, -1), (1, 1), (-1, 1)],
+                    shapely_helper=self.sh, voronoi_geo=self.vg)
+        version = cell.store.versions[cell.index]
+        cell.clip_with_halfplane((1, 0, 5), keep_positive=True)
+        self.assertEqual(cell.store.culled, 1)
+        self.assertEqual(cell.store.versions[cell.index], version)
+        cell.clip_with_halfplane((1, 0, -0.5), keep_positive=True)
+        self.assertEqual(cell.store.culled, 1)
+        self.assertAlmostEqual(cell.area(), 1.0)
+    
+    def test_insertion_counts_culled_clips(self):
+        """Test that both insertion modes report culled clips and agree"""
+        results = {}
+        for insertion in ("walk", "brute"):
+            vd = VoronoiDiagram(self.sh, self.vg, bbox=100, insertion=insertion)
+            results[insertion] = vd.incremental_voronoi(self.points)
+            stats = vd.store.clip_stats()
+            self.assertGreater(stats["culled"], 0)
+            self.assertGreater(stats["clipped"], 0)
+        for a, b in zip(results["walk"], results["brute"]):
+            diff = self.sh.Polygon(a.polygon).symmetric_difference(self.sh.Polygon(b.polygon))
+            self.assertAlmostEqual(diff.area, 0.0, places=6)
+
+
+class TestRobustPredicates(unittest.TestCase):
+    """Test filtered predicates with exact fallback"""
+    
+    def test_orientation_near_collinear(self):
+        """Test orientation of nearly collinear points against exact arithmetic"""
+        u = 2.0 ** -53
+        for i in range(32):
+            for j in range(32):
+                a = (0.5 + i * u, 0.5 + j * u)
+                self.assertEqual(Predicates.orient2d(a, (12.0, 12.0), (24.0, 24.0)),
+                                 Predicates.orient2d_exact(a, (12.0, 12.0), (24.0, 24.0)))
+    
+    def test_filter_skips_exact_path(self):
+        """Test that clear-cut cases never reach the exact fallback"""
+        calls = Predicates.exact_calls
+        self.assertEqual(Predicates.side((3.0, 1.0), (1.0, 0.0, -1.0)), 1)
+        self.assertEqual(Predicates.orient2d((0, 0), (1, 0), (0, 1)), 1)
+        self.assertEqual(Predicates.exact_calls, calls)
+    
+    def test_uncertain_side_uses_exact(self):
+        """Test that a near-zero side value is decided exactly"""
+        calls = Predicates.exact_calls
+        line = (0.1, 0.2, -0.3)
+        self.assertEqual(Predicates.side((1.0, 1.0), line), Predicates.side_exact((1.0, 1.0), line))
+        self.assertEqual(Predicates.side((2.0, 0.0), (1.0, 0.0, -2.0)), 0)
+        self.assertGreater(Predicates.exact_calls, calls)
+    
+    def test_batched_sides_match_scalar(self):
+        """Test that batched side tests agree with the scalar predicate"""
+        rng = random.Random(26)
+        pts = [(float(rng.randint(-4, 4)), float(rng.randint(-4, 4))) for _ in range(200)]
+        lines = [(0.1 * rng.randint(-3, 3), 0.1 * rng.randint(-3, 3), 0.1 * rng.randint(-3, 3))
+                 for _ in range(200)]
+        expected = [Predicates.side(p, line) for p, line in zip(pts, lines)]
+        self.assertEqual(Predicates.sides(pts, lines).tolist(), expected)
+    
+    def test_segment_endpoint_on_line(self):
+        """Test segment/line intersection when an endpoint lies on the line"""
+        vg = VoronoiGeometry(ShapelyHelper())
+        self.assertEqual(vg.intersect_segment_line((1.0, 0.0), (3.0, 2.0), (1.0, 0.0, -1.0)), (1.0, 0.0))
+        self.assertIsNone(vg.intersect_segment_line((2.0, 0.0), (3.0, 2.0), (1.0, 0.0, -1.0)))
+        self.assertIsNone(vg.intersect_segment_line((1.0, 0.0), (1.0, 2.0), (1.0, 0.0, -1.0)))
+    
+    def test_grid_diagram_stays_consistent(self):
+        """Test that a degenerate grid keeps symmetric labels and tiles the box"""
+        sh = ShapelyHelper()
+        vd = VoronoiDiagram(sh, VoronoiGeometry(sh), bbox=10)
+        cells = vd.incremental_voronoi([(x, y) for x in range(-4, 5, 2) for y in range(-4, 5, 2)])
+        self.assertAlmostEqual(sum(c.area() for c in cells), 400.0, places=9)
+        for cell in cells:
+            self.assertEqual(len(cell.polygon), len(set(cell.polygon)))
+            for site_id in cell.neighbor_ids():
+                self.assertIn(cell.site_id, vd.cell_by_id(site_id).neighbor_ids())
+
+
+class TestVertexPruning(unittest.TestCase):
+    """Test welding and pruning of redundant ring vertices"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sh = ShapelyHelper()
+        self.vg = VoronoiGeometry(self.sh)
+        self.polygon = [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+        self.labels = [7, 5, 5, 6, -1]
+    
+    def test_scalar_prunes_collinear_vertex(self):
+        """Test that a vertex between two edges of the same site is dropped"""
+        out, labels = self.vg.clip_labeled_polygon(self.polygon, self.labels, (0.0, 1.0, 5.0))
+        self.assertEqual(out, [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)])
+        self.assertEqual(labels, [7, 5, 6, -1])
+        self.assertEqual(self.vg.vertex_stats["pruned"], 1)
+    
+    def test_batched_matches_scalar(self):
+        """Test that the batched kernel prunes the same vertices"""
+        expected, expected_labels = self.vg.clip_labeled_polygon(self.polygon, self.labels, (0.0, 1.0, 5.0))
+        out, offsets, labels = self.vg.clip_polygons_by_halfplanes(
+            self.polygon, [0, 5], [(0.0, 1.0, 5.0)], True, self.labels
+        )
+        self.assertEqual([tuple(p) for p in out.tolist()], expected)
+        self.assertEqual(labels.tolist(), expected_labels)
+        self.assertEqual(self.vg.vertex_stats["pruned"], 2)
+    
+    def test_welding_near_duplicates(self):
+        """Test that intersections within eps of a vertex are welded"""
+        out, _ = self.vg.clip_labeled_polygon(
+            [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)], [-1, -1, -1, -1],
+            (1.0, 1.0, -1e-12), True, 3, 1e-9
+        )
+        self.assertEqual(len(out), 4)
+        self.assertEqual(self.vg.vertex_stats["welded"], 1)
+    
+    def test_rings_match_voronoi_degree(self):
+        """Test that every ring has one edge per neighbor and no redundant vertices"""
+        rng = random.Random(27)
+        grid = [(rng.randint(-9, 9), rng.randint(-9, 9)) for _ in range(200)]
+        for kwargs in ({}, {"insertion": "brute"}, {"engine": "sweep"}):
+            vd = VoronoiDiagram(self.sh, VoronoiGeometry(self.sh), bbox=100, **kwargs)
+            vd.incremental_voronoi(grid)
+            stats = vd.vertex_stats()
+            self.assertEqual(stats["redundant"], 0)
+            for cell in vd.cells:
+                sites = [s for s in cell.edge_sites if s >= 0]
+                self.assertEqual(len(sites), len(set(sites)))
+
+    def test_small_extent_rings(self):
+        """Test that welding keeps distinct vertices of tiny cells in the default bbox"""
+        rng = random.Random(31)
+        sites = [(rng.uniform(0, 1e-5), rng.uniform(0, 1e-5)) for _ in range(200)]
+        for kwargs in ({}, {"insertion": "brute"}, {"engine": "sweep"}):
+            vd = VoronoiDiagram(self.sh, VoronoiGeometry(self.sh), **kwargs)
+            vd.incremental_voronoi(sites)
+            stats = vd.vertex_stats()
+            self.assertEqual(stats["redundant"], 0)
+            for cell in vd.cells:
+                self.assertGreaterEqual(len(cell.polygon), 3)
+                self.assertGreater(cell.area(), 0)
+                labels = [s for s in cell.edge_sites if s >= 0]
+                self.assertEqual(len(labels), len(set(labels)))
+
+    def test_welding_is_relative_to_the_ring(self):
+        """Test that the same relative eps welds at any coordinate scale"""
+        for scale in (1e-6, 1.0, 1e6):
+            ring = [(0.0, 0.0), (2.0 * scale, 0.0), (2.0 * scale, 2.0 * scale), (0.0, 2.0 * scale)]
+            vg = VoronoiGeometry(self.sh)
+            out, _ = vg.clip_labeled_polygon(ring, [-1] * 4, (1.0, 1.0, -1e-12 * scale), True, 3, 1e-9)
+            self.assertEqual(len(out), 4)
+            self.assertEqual(vg.vertex_stats["welded"], 1)
+            out, _ = vg.clip_polygons_by_halfplanes(ring, [0, 4], [(1.0, 1.0, -1e-12 * scale)], True, eps=1e-9)
+            self.assertEqual(len(out), 4)
+
+
+class TestGeometryBackends(unittest.TestCase):
+    """Test the selectable geometry backends behind ShapelyHelper"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = random.Random(31)
+        self.sites = [(rng.uniform(-90, 90), rng.uniform(-90, 90)) for _ in range(150)]
+        self.queries = [(rng.uniform(-110, 110), rng.uniform(-110, 110)) for _ in range(2000)]
+    
+    def build(self, backend, **kwargs):
+        """Build a diagram on the given backend"""
+        sh = ShapelyHelper(backend)
+        vd = VoronoiDiagram(sh, VoronoiGeometry(sh), bbox=100, **kwargs)
+        vd.incremental_voronoi(self.sites)
+        return vd
+    
+    @unittest.skipUnless(HAS_SHAPELY2, "the shapely backend needs Shapely 2")
+    def test_backend_selection(self):
+        """Test that backends are selected by name and unknown names are rejected"""
+        for name in ("python", "numpy", "shapely"):
+            self.assertEqual(ShapelyHelper(name).backend.name, name)
+        self.assertEqual(ShapelyHelper().backend.name, "shapely")
+        with self.assertRaises(ValueError):
+            ShapelyHelper("cuda")
+    
+    @unittest.skipUnless(HAS_SHAPELY2, "the shapely backend needs Shapely 2")
+    def test_cell_dispatches_through_backend(self):
+        """Test that cells without a helper fall back to the NumPy backend"""
+        cell = Cell((0.5, 0.5), [(0, 0), (1, 0), (1, 1), (0, 1)])
+        self.assertIs(cell.backend(), DEFAULT_BACKEND)
+        self.assertTrue(cell.contains((0.25, 0.75)))
+        self.assertIsInstance(self.build("shapely").cells[0].prepared(), ShapelyHelper().Polygon)
+    
+    @unittest.skipUnless(HAS_SHAPELY2, "the shapely backend needs Shapely 2")
+    def test_contains_agrees(self):
+        """Test that scalar and batched containment agree across backends"""
+        reference = self.build("numpy")
+        for name in ("python", "shapely"):
+            vd = self.build(name)
+            for cell, expected in list(zip(vd.cells, reference.cells))[:20]:
+                mask = expected.contains_many(self.queries)
+                self.assertEqual(cell.contains_many(self.queries).tolist(), mask.tolist())
+                self.assertEqual([cell.contains(q) for q in self.queries[:200]], mask[:200].tolist())
+    
+    @unittest.skipUnless(HAS_SHAPELY2, "the shapely backend needs Shapely 2")
+    def test_brute_insertion_agrees(self):
+        """Test that batched clipping builds the same rings on every backend"""
+        reference = self.build("numpy", insertion="brute")
+        for name in ("python", "shapely"):
+            vd = self.build(name, insertion="brute")
+            for cell, expected in zip(vd.cells, reference.cells):
+                self.assertEqual(cell.edge_sites, expected.edge_sites)
+                for p, q in zip(cell.polygon, expected.polygon):
+                    self.assertAlmostEqual(p[0], q[0], places=9)
+                    self.assertAlmostEqual(p[1], q[1], places=9)
+    
+    @unittest.skipUnless(HAS_SHAPELY2, "the shapely backend needs Shapely 2")
+    def test_locate_many_agrees(self):
+        """Test that batch point location agrees across backends"""
+        expected = self.build("numpy").locate_many(self.queries).tolist()
+        self.assertIn(-1, expected)
+        for name in ("python", "shapely"):
+            self.assertEqual(self.build(name).locate_many(self.queries).tolist(), expected)
+
+        self.sites = [(x, y) for x in range(-80, 81, 20) for y in range(-80, 81, 20)]
+        queries = [(x + dx, y + dy) for x in range(-80, 81, 20) for y in range(-80, 81, 20)
+                   for dx, dy in ((10, 0), (0, 10), (10, 10))]
+        for name in ("python", "numpy", "shapely"):
+            vd = self.build(name)
+            owner = vd.locate_many(queries).tolist()
+            for q, i in zip(queries, owner):
+                d = [GeometryUtils.dist(cell.generator, q) for cell in vd.cells]
+                self.assertGreaterEqual(i, 0)
+                self.assertAlmostEqual(d[i], min(d), places=9)
+
+
 def run_tests_with_report():
     """Run all tests and generate a detailed report"""
     loader = unittest.TestLoader()
@@ -420,6 +1824,31 @@ def run_tests_with_report():
     suite.addTests(loader.loadTestsFromTestCase(TestVoronoiDiagram))
     suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
     suite.addTests(loader.loadTestsFromTestCase(TestAlgorithmProperties))
+    suite.addTests(loader.loadTestsFromTestCase(TestNeighborWalkInsertion))
+    suite.addTests(loader.loadTestsFromTestCase(TestSiteIndex))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchedClipping))
+    suite.addTests(loader.loadTestsFromTestCase(TestCellStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestCellCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchPointLocation))
+    suite.addTests(loader.loadTestsFromTestCase(TestScalarFastPath))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchedGeometryUtils))
+    suite.addTests(loader.loadTestsFromTestCase(TestBisectorCoefficients))
+    suite.addTests(loader.loadTestsFromTestCase(TestInsertionOrder))
+    suite.addTests(loader.loadTestsFromTestCase(TestRemoveSite))
+    suite.addTests(loader.loadTestsFromTestCase(TestMoveSite))
+    suite.addTests(loader.loadTestsFromTestCase(TestBulkInsertSites))
+    suite.addTests(loader.loadTestsFromTestCase(TestSweepEngine))
+    suite.addTests(loader.loadTestsFromTestCase(TestParallelConstruction))
+    suite.addTests(loader.loadTestsFromTestCase(TestStreamingConstruction))
+    suite.addTests(loader.loadTestsFromTestCase(TestInsertionEvents))
+    suite.addTests(loader.loadTestsFromTestCase(TestHalfEdgeMesh))
+    suite.addTests(loader.loadTestsFromTestCase(TestAdjacency))
+    suite.addTests(loader.loadTestsFromTestCase(TestWalkingLocate))
+    suite.addTests(loader.loadTestsFromTestCase(TestSpatialJoin))
+    suite.addTests(loader.loadTestsFromTestCase(TestClipCulling))
+    suite.addTests(loader.loadTestsFromTestCase(TestRobustPredicates))
+    suite.addTests(loader.loadTestsFromTestCase(TestVertexPruning))
+    suite.addTests(loader.loadTestsFromTestCase(TestGeometryBackends))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)